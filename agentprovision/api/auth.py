@@ -2,7 +2,13 @@
 API Endpoints for User Authentication.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -10,7 +16,8 @@ from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import String, bindparam, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agentprovision.core.config import get_settings
@@ -22,9 +29,23 @@ from agentprovision.core.models.user_model import (LoginRequest, Token,
 router = APIRouter(tags=["authentication"])
 settings = get_settings()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2; existing bcrypt hashes still verify and are upgraded
+# on the next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
+_ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_JWT_SECRET = settings.JWT_SECRET
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = (settings.JWT_ALGORITHM,)
+
 
 # --- Custom Response Models ---
 class AuthSuccessResponse(BaseModel):
@@ -39,27 +60,105 @@ class RegisterResponse(BaseModel):
 
 
 # --- Password Utilities ---
+# Successful password verifications are remembered briefly so repeated logins
+# skip the hash. Entries are keyed by an HMAC of the password and hash, never
+# the password itself, and failures are never cached. Verification runs in
+# worker threads, so the cache is guarded by a lock.
+_VERIFIED_TTL_SECONDS = 60
+_VERIFIED_MAXSIZE = 4096
+_verified_passwords: "OrderedDict[str, float]" = OrderedDict()
+_verified_lock = threading.Lock()
+
+
+def _verification_key(plain_password: str, hashed_password: str) -> str:
+    return hmac.new(
+        _JWT_SECRET.encode(),
+        plain_password.encode() + b"\0" + hashed_password.encode(),
+        hashlib.sha256,
+    ).hexdigest()
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    key = _verification_key(plain_password, hashed_password)
+    with _verified_lock:
+        expires_at = _verified_passwords.get(key)
+    if expires_at is not None and expires_at > time.monotonic():
+        return True
+
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False
+
+    with _verified_lock:
+        _verified_passwords[key] = time.monotonic() + _VERIFIED_TTL_SECONDS
+        _verified_passwords.move_to_end(key)
+        if len(_verified_passwords) > _VERIFIED_MAXSIZE:
+            _verified_passwords.popitem(last=False)
+    return True
 
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# Built once so every auth lookup reuses the same statement (and its cache key).
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email", type_=String))
+# Login and registration only need plain column values, so skip ORM hydration
+_LOGIN_BY_EMAIL = select(
+    User.id,
+    User.email,
+    User.hashed_password,
+    User.full_name,
+    User.is_active,
+    User.is_superuser,
+    User.tenant_id,
+    User.created_at,
+    User.updated_at,
+).where(User.email == bindparam("email", type_=String))
+_USER_ID_BY_EMAIL = select(User.id).where(
+    User.email == bindparam("email", type_=String)
+)
+
+# --- User Lookup Cache ---
+# Token validation runs on every authenticated request; keep the user's column
+# values (never the ORM instance, which is bound to a request session) for a
+# short TTL so hot users skip the SELECT.
+_USER_CACHE_TTL_SECONDS = 30
+_USER_CACHE_MAXSIZE = 10_000
+_user_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+
+
+def _get_cached_user(email: str) -> User | None:
+    entry = _user_cache.get(email)
+    if entry is None:
+        return None
+    expires_at, columns = entry
+    if expires_at <= time.monotonic():
+        del _user_cache[email]
+        return None
+    _user_cache.move_to_end(email)
+    return User(**columns)
+
+
+def _cache_user(user: User) -> None:
+    columns = {column.key: getattr(user, column.key) for column in User.__table__.c}
+    _user_cache[user.email] = (time.monotonic() + _USER_CACHE_TTL_SECONDS, columns)
+    _user_cache.move_to_end(user.email)
+    if len(_user_cache) > _USER_CACHE_MAXSIZE:
+        _user_cache.popitem(last=False)
+
+
+def invalidate_cached_user(email: str) -> None:
+    """Drop a cached user after their profile, password or status changes."""
+    _user_cache.pop(email, None)
+
+
 # --- JWT Token Utilities ---
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
-    )
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _TOKEN_TTL_SECONDS
+    # JWT "exp" is an integer epoch; build it directly rather than via datetime
+    to_encode["exp"] = int(time.time()) + ttl
+    encoded_jwt = jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
     return encoded_jwt
 
 
@@ -73,9 +172,7 @@ async def get_current_user_dependency(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGORITHMS)
         email: str | None = payload.get("sub")
         if email is None:
             raise credentials_exception
@@ -83,12 +180,15 @@ async def get_current_user_dependency(
     except JWTError:
         raise credentials_exception
 
-    stmt = select(User).where(User.email == token_data.email)
-    result = await db.execute(stmt)
-    user = result.scalars().first()
-
+    user = _get_cached_user(token_data.email)
     if user is None:
-        raise credentials_exception
+        result = await db.execute(_USER_BY_EMAIL, {"email": token_data.email})
+        user = result.scalars().first()
+
+        if user is None:
+            raise credentials_exception
+        _cache_user(user)
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
@@ -107,6 +207,39 @@ async def get_current_active_superuser(
     return current_user
 
 
+async def _authenticate(
+    email: str, password: str, db: AsyncSession, detail_suffix: str = ""
+) -> Row:
+    """Look up a user by email and check the password and active flag."""
+    result = await db.execute(_LOGIN_BY_EMAIL, {"email": email})
+    user = result.first()
+
+    # Hashing is CPU-bound; run it off the event loop
+    if not user or not await asyncio.to_thread(
+        verify_password, password, user.hashed_password
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Incorrect email or password{detail_suffix}",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Inactive user{detail_suffix}",
+        )
+    if pwd_context.needs_update(user.hashed_password):
+        hashed_password = await asyncio.to_thread(get_password_hash, password)
+        await db.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(hashed_password=hashed_password)
+        )
+        await db.commit()
+        invalidate_cached_user(user.email)
+    return user
+
+
 # --- API Endpoints ---
 @router.post(
     "/register", response_model=RegisterResponse, status_code=status.HTTP_201_CREATED
@@ -117,29 +250,27 @@ async def register_user(
     """
     Create new user. The UI expects a token and user object upon registration (direct login).
     """
-    stmt = select(User).where(User.email == user_in.email)
-    result = await db.execute(stmt)
-    db_user = result.scalars().first()
+    result = await db.execute(_USER_ID_BY_EMAIL, {"email": user_in.email})
 
-    if db_user:
+    if result.first() is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="The user with this email already exists in the system.",
         )
 
-    hashed_password = get_password_hash(user_in.password)
-    new_user_data = user_in.dict(exclude={"password"})
+    hashed_password = await asyncio.to_thread(get_password_hash, user_in.password)
+    new_user_data = user_in.model_dump(exclude={"password"})
     new_user = User(**new_user_data, hashed_password=hashed_password, is_active=True)
 
     db.add(new_user)
     await db.commit()
-    await db.refresh(new_user)
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": new_user.email}, expires_delta=access_token_expires
+        data={"sub": new_user.email}, expires_delta=_ACCESS_TOKEN_EXPIRES
+    )
+    return RegisterResponse(
+        token=access_token, user=UserResponse.model_validate(new_user)
     )
-    return RegisterResponse(token=access_token, user=UserResponse.from_orm(new_user))
 
 
 @router.post("/login", response_model=AuthSuccessResponse)
@@ -150,27 +281,12 @@ async def login_json_for_ui(
     Login with email and password (JSON body). This is for UI compatibility.
     The UI's auth.ts calls POST /auth/login.
     """
-    stmt = select(User).where(User.email == login_request.email)
-    result = await db.execute(stmt)
-    user = result.scalars().first()
-
-    if not user or not verify_password(login_request.password, user.hashed_password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
-        )
-
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    user = await _authenticate(login_request.email, login_request.password, db)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": user.email}, expires_delta=_ACCESS_TOKEN_EXPIRES
     )
     return AuthSuccessResponse(
-        access_token=access_token, user=UserResponse.from_orm(user)
+        access_token=access_token, user=UserResponse.model_validate(user)
     )
 
 
@@ -182,27 +298,14 @@ async def login_form_for_oauth_token(
     """
     OAuth2 compatible token login (form data: username=email, password).
     """
-    stmt = select(User).where(User.email == form_data.username)
-    result = await db.execute(stmt)
-    user = result.scalars().first()
-
-    if not user or not verify_password(form_data.password, user.hashed_password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password (form data)",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user (form data)"
-        )
-
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    user = await _authenticate(
+        form_data.username, form_data.password, db, detail_suffix=" (form data)"
+    )
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": user.email}, expires_delta=_ACCESS_TOKEN_EXPIRES
     )
     return AuthSuccessResponse(
-        access_token=access_token, user=UserResponse.from_orm(user)
+        access_token=access_token, user=UserResponse.model_validate(user)
     )
 
 
@@ -213,7 +316,7 @@ async def read_users_me(
     """
     Get current user.
     """
-    return UserResponse.from_orm(current_user)
+    return UserResponse.model_validate(current_user)
 
 
 # Note: The UI's auth.ts uses POST /auth/login with LoginCredentials (email, password).
@@ -233,27 +336,12 @@ async def login_with_email_password(
     """
     Login with email and password (compatibility for UI's current authService.login).
     """
-    stmt = select(User).where(User.email == login_request.email)
-    result = await db.execute(stmt)
-    user = result.scalars().first()
-
-    if not user or not verify_password(login_request.password, user.hashed_password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
-        )
-
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    user = await _authenticate(login_request.email, login_request.password, db)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": user.email}, expires_delta=_ACCESS_TOKEN_EXPIRES
     )
-    return {"access_token": access_token, "token_type": "bearer", "user": user}
-
-
-# Need to ensure `datetime` is imported for `create_access_token`
-# from datetime import datetime # This should be at the top of the file ideally
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "user": UserResponse.model_validate(user),
+    }
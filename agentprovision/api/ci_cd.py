@@ -1,25 +1,28 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from agentprovision.core.ci_cd.pipeline import PipelineService
 
 router = APIRouter(prefix="/pipeline", tags=["CI/CD"])
 
-pipeline_service = PipelineService()
+
+def get_pipeline_service(request: Request) -> PipelineService:
+    """Get the PipelineService created at application startup."""
+    return request.app.state.pipeline_service
 
 
 @router.post("/build")
-def build():
+def build(pipeline_service: PipelineService = Depends(get_pipeline_service)):
     result = pipeline_service.build()
     return {"result": result}
 
 
 @router.post("/test")
-def test():
+def test(pipeline_service: PipelineService = Depends(get_pipeline_service)):
     result = pipeline_service.test()
     return {"result": result}
 
 
 @router.post("/deploy")
-def deploy():
+def deploy(pipeline_service: PipelineService = Depends(get_pipeline_service)):
     result = pipeline_service.deploy()
     return {"result": result}
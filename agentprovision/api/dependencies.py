@@ -1,14 +1,21 @@
+from functools import lru_cache
+
 from fastapi import Depends
 
 from ..core.file_manager import FileManager
 from ..core.ticket_manager import TicketManager
 
 
+# Both managers are process-wide: building them per request repeated the
+# setup work and gave every watch its own FileManager. lru_cache keeps them
+# as plain dependencies, so app.dependency_overrides still works in tests.
+@lru_cache(maxsize=1)
 def get_file_manager() -> FileManager:
-    """Get a FileManager instance."""
+    """Get the shared FileManager instance."""
     return FileManager()
 
 
+@lru_cache(maxsize=1)
 def get_ticket_manager() -> TicketManager:
-    """Get a TicketManager instance."""
+    """Get the shared TicketManager instance."""
     return TicketManager()
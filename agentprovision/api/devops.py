@@ -2,26 +2,69 @@
 DevOps API endpoints for monitoring, alerting, and infrastructure management.
 """
 
-from typing import Dict, List, Optional
+import asyncio
+import os
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
-from agentprovision.core.config import get_settings
 from agentprovision.core.devops.service import DevOpsService
 
 router = APIRouter(prefix="/devops", tags=["devops"])
-settings = get_settings()
 
-# Initialize DevOps service
-devops_service = DevOpsService(
-    prometheus_url=settings.PROMETHEUS_URL, grafana_url=settings.GRAFANA_URL
-)
+
+def get_devops_service(request: Request) -> DevOpsService:
+    """Get the DevOpsService created at application startup."""
+    return request.app.state.devops_service
+
+
+class _TTLCache:
+    """Per-key TTL cache; concurrent misses on a key share one upstream call.
+
+    Only successful (truthy) results are stored: an empty result or an
+    exception is returned or raised to the caller and retried on the next call.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._store: Dict[str, Tuple[float, Any]] = {}
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def _fresh(self, key: str) -> Optional[Tuple[float, Any]]:
+        entry = self._store.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            return entry
+        return None
+
+    async def get_or_set(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._fresh(key)
+        if entry is None:
+            async with self._locks[key]:
+                # Another request may have refreshed it while we waited
+                entry = self._fresh(key)
+                if entry is None:
+                    value = await fetch()
+                    if not value:
+                        return value
+                    entry = (time.monotonic(), value)
+                    self._store[key] = entry
+        return entry[1]
+
+
+# Prometheus only scrapes every 15-30s, and these endpoints are scraped
+# themselves, so a few seconds of reuse saves most upstream queries.
+_upstream_cache = _TTLCache(float(os.getenv("DEVOPS_METRICS_CACHE_TTL", "5.0")))
 
 
 class IncidentCreate(BaseModel):
     """Model for creating a new incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     severity: str
     description: str
@@ -30,64 +73,91 @@ class IncidentCreate(BaseModel):
 class IncidentUpdate(BaseModel):
     """Model for updating an incident."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: Optional[str] = None
     updates: Optional[List[str]] = None
 
 
+# These routes return plain JSON-native dicts, so they hand them to orjson
+# directly instead of running them through jsonable_encoder first.
 @router.get("/metrics/system")
-async def get_system_metrics():
+async def get_system_metrics(
+    devops_service: DevOpsService = Depends(get_devops_service),
+):
     """Get current system metrics."""
-    metrics = await devops_service.get_system_metrics()
+    metrics = await _upstream_cache.get_or_set(
+        "system", devops_service.get_system_metrics
+    )
     if not metrics:
         raise HTTPException(status_code=500, detail="Failed to fetch system metrics")
-    return metrics
+    return ORJSONResponse(metrics)
 
 
 @router.get("/metrics/application")
-async def get_application_metrics():
+async def get_application_metrics(
+    devops_service: DevOpsService = Depends(get_devops_service),
+):
     """Get application performance metrics."""
-    metrics = await devops_service.get_application_metrics()
+    metrics = await _upstream_cache.get_or_set(
+        "application", devops_service.get_application_metrics
+    )
     if not metrics:
         raise HTTPException(
             status_code=500, detail="Failed to fetch application metrics"
         )
-    return metrics
+    return ORJSONResponse(metrics)
 
 
 @router.get("/alerts")
-async def get_alerts():
+async def get_alerts(devops_service: DevOpsService = Depends(get_devops_service)):
     """Get current alert status."""
-    alerts = await devops_service.get_alert_status()
-    return alerts
+    alerts = await _upstream_cache.get_or_set("alerts", devops_service.get_alert_status)
+    return ORJSONResponse(alerts)
 
 
 @router.get("/incidents")
-async def get_incidents(days: int = 7):
+async def get_incidents(
+    days: int = 7,
+    devops_service: DevOpsService = Depends(get_devops_service),
+):
     """Get incident history."""
     incidents = await devops_service.get_incident_history(days)
-    return incidents
+    return ORJSONResponse(incidents)
 
 
 @router.post("/incidents")
-async def create_incident(incident: IncidentCreate):
+async def create_incident(
+    incident: IncidentCreate,
+    devops_service: DevOpsService = Depends(get_devops_service),
+):
     """Create a new incident."""
-    new_incident = await devops_service.create_incident(incident.dict())
-    return new_incident
+    new_incident = await devops_service.create_incident(
+        incident.model_dump(mode="json")
+    )
+    return ORJSONResponse(new_incident)
 
 
 @router.put("/incidents/{incident_id}")
-async def update_incident(incident_id: str, update: IncidentUpdate):
+async def update_incident(
+    incident_id: str,
+    update: IncidentUpdate,
+    devops_service: DevOpsService = Depends(get_devops_service),
+):
     """Update an existing incident."""
     updated_incident = await devops_service.update_incident(
-        incident_id, update.dict(exclude_unset=True)
+        incident_id, update.model_dump(mode="json", exclude_unset=True)
     )
-    return updated_incident
+    return ORJSONResponse(updated_incident)
 
 
 @router.get("/dashboards/{dashboard_id}")
-async def get_dashboard(dashboard_id: str):
+async def get_dashboard(
+    dashboard_id: str,
+    devops_service: DevOpsService = Depends(get_devops_service),
+):
     """Get dashboard data."""
     dashboard = await devops_service.get_dashboard_data(dashboard_id)
     if not dashboard:
         raise HTTPException(status_code=404, detail="Dashboard not found")
-    return dashboard
+    return ORJSONResponse(dashboard)
@@ -1,46 +1,73 @@
+import asyncio
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
+import aiofiles
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 router = APIRouter(prefix="/files", tags=["files"])
 
+# Target directory for each supported fileType; created once at startup
+_FILE_DIRS = {
+    "code": Path("generated") / "code",
+    "test": Path("generated") / "tests",
+}
+
+
+def ensure_file_dirs() -> None:
+    """Create the directories generated files are written to."""
+    for target_dir in _FILE_DIRS.values():
+        target_dir.mkdir(parents=True, exist_ok=True)
+
 
 class FileWriteRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     content: str
     fileName: str
     fileType: str
 
 
+class FileWriteBatch(BaseModel):
+    files: List[FileWriteRequest]
+
+
 class FileWriteResponse(BaseModel):
     success: bool
     message: str
     filePath: Optional[str] = None
 
 
+def _target_path(request: FileWriteRequest) -> Path:
+    """Validate the request's type and name and return where to write it."""
+    target_dir = _FILE_DIRS.get(request.fileType)
+    if target_dir is None:
+        raise HTTPException(status_code=400, detail="Invalid file type")
+
+    # Only a bare file name is accepted; no paths or traversal
+    file_name = Path(request.fileName).name
+    if file_name in ("", ".", "..") or file_name != request.fileName:
+        raise HTTPException(status_code=400, detail="Invalid file name")
+    return target_dir / file_name
+
+
+def _write_all(writes: List[Tuple[Path, str]]) -> None:
+    """Blocking write of several files, run as a single worker-thread job."""
+    for file_path, content in writes:
+        with open(file_path, "w") as f:
+            f.write(content)
+
+
 @router.post("/write", response_model=FileWriteResponse)
 async def write_file(request: FileWriteRequest):
     try:
-        # Create appropriate directory based on file type
-        base_dir = Path("generated")
-        if request.fileType == "code":
-            target_dir = base_dir / "code"
-        elif request.fileType == "test":
-            target_dir = base_dir / "tests"
-        else:
-            raise HTTPException(status_code=400, detail="Invalid file type")
-
-        # Ensure directory exists
-        target_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create file path
-        file_path = target_dir / request.fileName
+        file_path = _target_path(request)
 
-        # Write content to file
-        with open(file_path, "w") as f:
-            f.write(request.content)
+        # Write content to file without blocking the event loop
+        async with aiofiles.open(file_path, "w") as f:
+            await f.write(request.content)
 
         return FileWriteResponse(
             success=True,
@@ -48,5 +75,32 @@ async def write_file(request: FileWriteRequest):
             filePath=str(file_path),
         )
 
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/write_batch", response_model=List[FileWriteResponse])
+async def write_files(batch: FileWriteBatch):
+    """Write several files (e.g. code plus its tests) in one request."""
+    try:
+        # Validate everything before touching the disk
+        writes = [(_target_path(request), request.content) for request in batch.files]
+
+        # One thread hop for the whole batch instead of several per file
+        await asyncio.to_thread(_write_all, writes)
+
+        return [
+            FileWriteResponse(
+                success=True,
+                message=f"Successfully wrote {request.fileType} to {file_path}",
+                filePath=str(file_path),
+            )
+            for request, (file_path, _) in zip(batch.files, writes)
+        ]
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
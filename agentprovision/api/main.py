@@ -2,17 +2,28 @@
 Main FastAPI application entry point for agentprovision.
 """
 
+import asyncio
+import hashlib
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from fastapi import Depends, FastAPI
+import orjson
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from opentelemetry import trace
 from opentelemetry.exporter.prometheus import PrometheusMetricReader
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from prometheus_client import start_http_server
+from opentelemetry.sdk.trace.sampling import ParentBasedTraceIdRatio
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
 
 from agentprovision.api.auth import router as auth_router
 from agentprovision.api.ci_cd import router as ci_cd_router
@@ -27,13 +38,15 @@ from agentprovision.api.routes.agent_runtime_routes import \
     router as agent_runtime_router
 from agentprovision.api.routes.chat_routes import router as chat_router
 from agentprovision.api.routes.llm_routes import router as llm_router
+from agentprovision.api.routes.monitoring_routes import \
+    router as monitoring_router
 from agentprovision.api.routes.orchestration_routes import \
     router as orchestration_router
 from agentprovision.api.test_gen import router as test_gen_router
 from agentprovision.api.tickets import router as tickets_router
 from agentprovision.api.version_control import router as version_control_router
 from agentprovision.core.config import get_settings
-from agentprovision.core.database import get_session, init_db
+from agentprovision.core.database import get_engine, get_session, init_db
 from agentprovision.core.models.user_model import \
     User  # Assuming User model is needed for startup
 from agentprovision.core.services.agent_orchestrator import \
@@ -41,15 +54,21 @@ from agentprovision.core.services.agent_orchestrator import \
 from agentprovision.core.services.integration_hub import \
     get_integration_hub  # Import the integration hub
 
-# Initialize OpenTelemetry
-trace.set_tracer_provider(TracerProvider())
+settings = get_settings()
+
+# Initialize OpenTelemetry; sample a fraction of root traces and let child
+# spans follow their parent's decision. The provider is process-global, so
+# re-importing this module (test reloads) must not try to replace it.
+if not isinstance(trace.get_tracer_provider(), TracerProvider):
+    trace.set_tracer_provider(
+        TracerProvider(sampler=ParentBasedTraceIdRatio(settings.TRACING_SAMPLE_RATIO))
+    )
 tracer = trace.get_tracer(__name__)
 
 logger = logging.getLogger(__name__)
 
 # Initialize Prometheus metrics
 metric_reader = PrometheusMetricReader()
-start_http_server(port=8001, addr="0.0.0.0")
 
 # Create FastAPI app
 app = FastAPI(
@@ -59,20 +78,60 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
-settings = get_settings()
+_cors_origins = frozenset(settings.ALLOWED_ORIGINS)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,  # Changed to uppercase
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit allowlists: origin checks become set lookups and preflight
+    # responses are precomputed instead of echoing the requested headers.
+    allow_origins=_cors_origins,
+    # A "*" origin list may not be combined with credentials (CORS spec);
+    # only allow credentials when the origins are spelled out.
+    allow_credentials="*" not in _cors_origins,
+    allow_methods=("GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"),
+    allow_headers=("authorization", "content-type", settings.TENANT_HEADER.lower()),
 )
 
+
+class _EventStreamAwareGZipResponder(GZipResponder):
+    """GZipResponder that passes text/event-stream responses through as-is.
+
+    Starlette's responder buffers streamed bodies into one gzip stream, which
+    would hold SSE frames back until the connection closes.
+    """
+
+    async def send_with_gzip(self, message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if content_type.startswith("text/event-stream"):
+                # Treated like an already-encoded body: sent frame by frame
+                self.content_encoding_set = True
+
+
+class _EventStreamAwareGZipMiddleware(GZipMiddleware):
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get(
+            "Accept-Encoding", ""
+        ):
+            responder = _EventStreamAwareGZipResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel
+            )
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+# Compress larger responses (notably the Prometheus text on /metrics), but
+# never event streams
+app.add_middleware(_EventStreamAwareGZipMiddleware, minimum_size=1024)
+
 # Instrument FastAPI
-FastAPIInstrumentor.instrument_app(app)
+# (probe and scrape endpoints are hit constantly and not worth tracing)
+FastAPIInstrumentor.instrument_app(app, excluded_urls="/health$,/metrics$")
 
 # Include routers with proper prefixes for multi-tenant support
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["Authentication"])
@@ -85,13 +144,37 @@ app.include_router(orchestration_router, prefix="/api/v1", tags=["Orchestration"
 app.include_router(llm_router, prefix="/api/v1", tags=["LLM Engine"])
 app.include_router(agent_runtime_router, prefix="/api/v1", tags=["Agent Runtime"])
 app.include_router(chat_router, prefix="/api/v1", tags=["Chat Interface"])
+# Carries its own /api/monitoring prefix
+app.include_router(monitoring_router)
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
+    # Password hashing and other blocking work is offloaded with to_thread;
+    # size the default pool for it explicitly.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2))
+    )
     await init_db()
 
+    # Services the routers read from app.state
+    from agentprovision.core.ci_cd.pipeline import PipelineService
+    from agentprovision.core.devops.service import DevOpsService
+    from agentprovision.core.planning.engine import (PlanningEngine,
+                                                     SolutionPlanner)
+
+    app.state.devops_service = DevOpsService(
+        prometheus_url=settings.PROMETHEUS_URL, grafana_url=settings.GRAFANA_URL
+    )
+    app.state.pipeline_service = PipelineService()
+    app.state.planning_engine = PlanningEngine()
+    app.state.solution_planner = SolutionPlanner()
+
+    from agentprovision.api.files import ensure_file_dirs
+
+    ensure_file_dirs()
+
     # Start core services
     from agentprovision.core.services.agent_orchestrator import \
         get_orchestrator
@@ -129,27 +212,78 @@ async def startup_event():
     logger.info("All core services started successfully")
 
 
-@app.get("/")
-async def root():
-    """Root endpoint returning basic API information."""
-    return {
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on shutdown."""
+    from agentprovision.api.dependencies import get_ticket_manager
+    from agentprovision.core.tools.tool_framework import get_tool_registry
+
+    # Only a manager that was actually built can hold buffered interactions
+    if get_ticket_manager.cache_info().currsize:
+        await get_ticket_manager().flush_all_interactions()
+    await get_tool_registry().close()
+    await get_engine().dispose()
+
+
+# The root payload never changes, so serialize it and its ETag once
+_ROOT_BODY = orjson.dumps(
+    {
         "name": "agentprovision",
         "version": "1.0.0",
         "status": "operational",
         "description": "Enterprise-Grade Multi-Agent Platform",
         "documentation": "/api/docs",
     }
+)
+_ROOT_ETAG = f'"{hashlib.sha1(_ROOT_BODY).hexdigest()}"'
+_ROOT_HEADERS = {"ETag": _ROOT_ETAG, "Cache-Control": "public, max-age=60"}
+
+
+@app.get("/")
+async def root(request: Request):
+    """Root endpoint returning basic API information."""
+    if request.headers.get("if-none-match") == _ROOT_ETAG:
+        return Response(status_code=304, headers=_ROOT_HEADERS)
+    return Response(
+        content=_ROOT_BODY, media_type="application/json", headers=_ROOT_HEADERS
+    )
+
+
+# Served on the app's own port instead of a second Prometheus server
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus exposition for the default registry."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+# Probes hit /health every few seconds; share one database check per TTL window
+_HEALTH_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL", "1.0"))
+_health_cache = {"ts": 0.0, "database": None}
+_health_lock = asyncio.Lock()
+
+
+async def _database_status(db: AsyncSession) -> str:
+    """Run (or reuse a recent) SELECT 1 against the database."""
+    if time.monotonic() - _health_cache["ts"] < _HEALTH_CACHE_TTL:
+        return _health_cache["database"]
+    async with _health_lock:
+        # Another request may have refreshed the cache while we waited
+        if time.monotonic() - _health_cache["ts"] < _HEALTH_CACHE_TTL:
+            return _health_cache["database"]
+        try:
+            await db.execute(text("SELECT 1"))
+            db_status = "healthy"
+        except Exception as e:
+            db_status = f"unhealthy: {str(e)}"
+        _health_cache["database"] = db_status
+        _health_cache["ts"] = time.monotonic()
+    return db_status
 
 
 @app.get("/health")
 async def health_check(db: AsyncSession = Depends(get_session)):
     """Health check endpoint with detailed status information."""
-    try:
-        # Test database connection
-        await db.execute("SELECT 1")
-        db_status = "healthy"
-    except Exception as e:
-        db_status = f"unhealthy: {str(e)}"
+    db_status = await _database_status(db)
 
     return {
         "status": "healthy",
@@ -2,29 +2,41 @@
 API endpoints for solution planning.
 """
 
+import asyncio
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from agentprovision.core.database import get_session
 from agentprovision.core.planning.engine import PlanningEngine, SolutionPlanner
 from agentprovision.core.planning.models import (SolutionPlan,
                                                  SolutionPlanResponse, Task,
                                                  TaskResponse)
-from agentprovision.core.ticket_engine.models import Requirement, Ticket
+from agentprovision.core.ticket_engine.models import Ticket
 
 router = APIRouter(prefix="/plans", tags=["plans"])
-planning_engine = PlanningEngine()
-planner = SolutionPlanner()
+
+
+# The engine and planner are created once at application startup
+def get_planning_engine(request: Request) -> PlanningEngine:
+    """Get the application's PlanningEngine."""
+    return request.app.state.planning_engine
+
+
+def get_solution_planner(request: Request) -> SolutionPlanner:
+    """Get the application's SolutionPlanner."""
+    return request.app.state.solution_planner
 
 
 @router.post("/tickets/{ticket_id}", response_model=SolutionPlanResponse)
 async def create_solution_plan(
-    ticket_id: str, db: AsyncSession = Depends(get_session)
+    ticket_id: str,
+    db: AsyncSession = Depends(get_session),
+    planning_engine: PlanningEngine = Depends(get_planning_engine),
 ) -> SolutionPlanResponse:
     """
     Create a solution plan for a ticket.
@@ -36,17 +48,18 @@ async def create_solution_plan(
     Returns:
         The created solution plan
     """
-    # Get ticket
-    ticket_stmt = select(Ticket).where(Ticket.id == ticket_id)
+    # Get ticket and its requirements in a single joined query
+    ticket_stmt = (
+        select(Ticket)
+        .options(joinedload(Ticket.requirements))
+        .where(Ticket.id == ticket_id)
+    )
     ticket_result = await db.execute(ticket_stmt)
-    ticket = ticket_result.scalars().first()
+    ticket = ticket_result.unique().scalar_one_or_none()
     if not ticket:
         raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
 
-    # Get requirements
-    req_stmt = select(Requirement).where(Requirement.ticket_id == ticket_id)
-    req_result = await db.execute(req_stmt)
-    requirements = req_result.scalars().all()
+    requirements = ticket.requirements
     if not requirements:
         raise HTTPException(
             status_code=400, detail=f"No requirements found for ticket {ticket_id}"
@@ -60,23 +73,9 @@ async def create_solution_plan(
         db.add(plan_to_save)
         await db.commit()
 
-        # Fetch the saved plan with tasks eagerly loaded to ensure they are available for Pydantic
-        # This is more reliable than db.refresh() for complex relationship loading for serialization
-        stmt = (
-            select(SolutionPlan)
-            .options(selectinload(SolutionPlan.tasks))
-            .where(SolutionPlan.id == plan_to_save.id)
-        )
-        result = await db.execute(stmt)
-        created_plan = result.scalars().first()
-
-        if not created_plan:
-            # This should ideally not happen if commit was successful
-            raise HTTPException(
-                status_code=500, detail="Failed to retrieve created plan after saving."
-            )
-
-        return created_plan
+        # The session keeps attributes loaded after commit and the tasks were
+        # built in memory, so the plan can be returned without a refetch
+        return plan_to_save
     except Exception as e:
         # Log the exception for debugging
         # logger.error(f"Error creating solution plan: {e}", exc_info=True)
@@ -105,7 +104,7 @@ async def get_solution_plan(
         .where(SolutionPlan.id == plan_id)
     )
     plan_result = await db.execute(plan_stmt)
-    plan = plan_result.scalars().first()
+    plan = plan_result.scalar_one_or_none()
     if not plan:
         raise HTTPException(status_code=404, detail=f"Plan {plan_id} not found")
 
@@ -162,6 +161,8 @@ async def list_solution_plans(
 
 
 class PlanRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     task_description: str
 
 
@@ -170,9 +171,12 @@ class PlanResponse(BaseModel):
 
 
 @router.post("/generate", response_model=PlanResponse)
-def generate_plan(request: PlanRequest):
+async def generate_plan(
+    request: PlanRequest, planner: SolutionPlanner = Depends(get_solution_planner)
+):
     try:
-        plan = planner.generate_plan(request.task_description)
+        # The Gemini client is synchronous; keep the blocking call off the loop
+        plan = await asyncio.to_thread(planner.generate_plan, request.task_description)
         return PlanResponse(plan=plan)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Plan generation failed: {str(e)}")
@@ -1,7 +1,11 @@
-from typing import Dict, List, Optional
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, Response
+from pydantic import BaseModel, TypeAdapter
 
 from ...core.file_manager import FileManager
 from ..dependencies import get_file_manager
@@ -42,13 +46,53 @@ class FileComparison(BaseModel):
     modified: List[str]
 
 
+# Built once at import. The routes below return ready-made JSON responses,
+# so response_model only documents them and FastAPI does not validate and
+# re-encode the (possibly large, recursive) bodies a second time.
+_FILE_NODES = TypeAdapter(List[FileNode])
+_SEARCH_RESULTS = TypeAdapter(List[SearchResult])
+
+
+def _json_response(adapter: TypeAdapter, data: Any) -> Response:
+    """Validate data against adapter and serialise it in one pydantic-core pass."""
+    return Response(
+        adapter.dump_json(adapter.validate_python(data)),
+        media_type="application/json",
+    )
+
+
+# Serialised listings per path, with the directory mtimes they were built
+# from; an entry is reused for as long as none of those directories change
+_LISTING_CACHE_MAXSIZE = 256
+_listing_cache: "OrderedDict[str, Tuple[Tuple[Tuple[str, int], ...], bytes]]" = (
+    OrderedDict()
+)
+
+
+async def _listing_json(path: str, file_manager: FileManager) -> bytes:
+    """JSON body for a listing, served from the cache while it is current."""
+    entry = _listing_cache.get(path)
+    if entry is not None and await file_manager.listing_unchanged(entry[0]):
+        _listing_cache.move_to_end(path)
+        return entry[1]
+
+    nodes, stamps = await file_manager.list_files_stamped(path)
+    body = _FILE_NODES.dump_json(_FILE_NODES.validate_python(nodes))
+    _listing_cache[path] = (stamps, body)
+    _listing_cache.move_to_end(path)
+    if len(_listing_cache) > _LISTING_CACHE_MAXSIZE:
+        _listing_cache.popitem(last=False)
+    return body
+
+
 @router.get("/list/{path:path}", response_model=List[FileNode])
 async def list_files(
     path: str = "", file_manager: FileManager = Depends(get_file_manager)
 ):
     """List files and directories in the specified path."""
     try:
-        return await file_manager.list_files(path)
+        body = await _listing_json(path, file_manager)
+        return Response(body, media_type="application/json")
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -60,7 +104,8 @@ async def read_file(path: str, file_manager: FileManager = Depends(get_file_mana
     """Read the content of a file."""
     try:
         content, language = await file_manager.read_file(path)
-        return FileContent(content=content, language=language)
+        body = FileContent(content=content, language=language).model_dump_json()
+        return Response(body, media_type="application/json")
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
@@ -69,6 +114,29 @@ async def read_file(path: str, file_manager: FileManager = Depends(get_file_mana
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.api_route("/raw/{path:path}", methods=["GET", "HEAD"])
+async def read_raw_file(
+    path: str, file_manager: FileManager = Depends(get_file_manager)
+):
+    """
+    Send a file's bytes as-is (sendfile where available).
+
+    Prefer this over /read for large files: /read JSON-escapes the whole
+    content. The language is returned in the X-Language header, so HEAD is
+    enough to look it up.
+    """
+    try:
+        full_path, media_type, language = file_manager.raw_file_info(path)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return FileResponse(
+        full_path, media_type=media_type, headers={"X-Language": language}
+    )
+
+
 @router.post("/write/{path:path}")
 async def write_file(
     path: str,
@@ -147,16 +215,19 @@ async def move_file(
 
 @router.get("/search", response_model=List[SearchResult])
 async def search_files(
-    query: str = Query(..., description="Search query string"),
+    query: List[str] = Query(
+        ..., description="Search query string; repeat to match any of several"
+    ),
     path: str = Query("", description="Path to search in"),
     case_sensitive: bool = Query(
         False, description="Whether the search should be case sensitive"
     ),
     file_manager: FileManager = Depends(get_file_manager),
 ):
-    """Search for files containing the query string."""
+    """Search for files containing the query string (any of them, if repeated)."""
     try:
-        return await file_manager.search_files(query, path, case_sensitive)
+        results = await file_manager.search_files(query, path, case_sensitive)
+        return _json_response(_SEARCH_RESULTS, results)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -165,7 +236,9 @@ async def search_files(
 
 @router.get("/search/name", response_model=List[SearchResult])
 async def search_by_name(
-    pattern: str = Query(..., description="File name pattern to search for"),
+    pattern: List[str] = Query(
+        ..., description="File name pattern to search for; repeat for several"
+    ),
     path: str = Query("", description="Path to search in"),
     case_sensitive: bool = Query(
         False, description="Whether the search should be case sensitive"
@@ -174,13 +247,18 @@ async def search_by_name(
 ):
     """Search for files matching the name pattern."""
     try:
-        return await file_manager.search_by_name(pattern, path, case_sensitive)
+        results = await file_manager.search_by_name(pattern, path, case_sensitive)
+        return _json_response(_SEARCH_RESULTS, results)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Change events queued per watcher before the oldest ones are dropped
+_WATCH_QUEUE_SIZE = 1024
+
+
 @router.websocket("/watch/{path:path}")
 async def watch_directory(
     websocket: WebSocket,
@@ -190,23 +268,44 @@ async def watch_directory(
     """Watch a directory for file changes."""
     try:
         await websocket.accept()
+        changes: asyncio.Queue = asyncio.Queue(maxsize=_WATCH_QUEUE_SIZE)
 
         async def notify_change(file_path: str, event_type: str):
-            await websocket.send_json({"path": file_path, "event": event_type})
+            # Serialised once here with orjson; sent as a text frame below
+            change = orjson.dumps({"path": file_path, "event": event_type}).decode()
+            if changes.full():
+                # A client this far behind gets the newest events, not all
+                changes.get_nowait()
+            changes.put_nowait(change)
 
         await file_manager.watch_directory(path, notify_change)
 
+        # Clients never send anything; reading only detects the disconnect
+        closed = asyncio.create_task(_wait_for_disconnect(websocket))
         try:
             while True:
-                # Keep the connection alive
-                await websocket.receive_text()
-        except Exception:
+                change = asyncio.create_task(changes.get())
+                done, _ = await asyncio.wait(
+                    {change, closed}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if change not in done:
+                    change.cancel()
+                    break
+                await websocket.send_text(change.result())
+        finally:
+            closed.cancel()
             # Clean up when the connection is closed
             await file_manager.unwatch_directory(path, notify_change)
     except Exception as e:
         await websocket.close(code=1000, reason=str(e))
 
 
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    """Return once the client disconnects, discarding anything it sends."""
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
 @router.get("/compare", response_model=FileComparison)
 async def compare_files(
     file1: str = Query(..., description="Path to first file"),
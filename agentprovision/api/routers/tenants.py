@@ -1,16 +1,65 @@
 import random
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agentprovision.api.auth import get_current_user_dependency
-from agentprovision.api.schemas.tenant import (RecentExecution, TenantOverview,
-                                               TenantRead, TenantStats)
+from agentprovision.api.schemas.tenant import (RecentExecution, TenantCreate,
+                                               TenantOverview, TenantRead,
+                                               TenantStats, TenantUpdate)
+from agentprovision.api.services import tenant_service
 from agentprovision.core.database import get_session
 from agentprovision.core.models.user_model import User
 
-router = APIRouter(prefix="/tenants", tags=["tenants"])
+# The one tenants router (it used to be split across tenant.py and this
+# module); responses go out through orjson
+router = APIRouter(
+    prefix="/tenants", tags=["tenants"], default_response_class=ORJSONResponse
+)
+
+
+@router.post("/", response_model=TenantRead, status_code=status.HTTP_201_CREATED)
+async def create_tenant(
+    tenant: TenantCreate,
+    db: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user_dependency),
+):
+    # Consider adding checks for duplicate slug/name here or in service layer
+    # if they need to be unique and are not handled by DB constraints directly for API responses
+    return await tenant_service.create_tenant(db, tenant)
+
+
+@router.get("/", response_model=List[TenantRead])
+async def list_tenants(
+    response: Response,
+    db: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user_dependency),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),  # Max limit 200
+    name_filter: Optional[str] = Query(None, alias="name"),
+    is_active_filter: Optional[bool] = Query(None, alias="isActive"),
+    subscription_tier_filter: Optional[str] = Query(None, alias="subscriptionTier"),
+    after_id: Optional[int] = Query(None, alias="afterId"),
+):
+    # Prefer ?afterId=<X-Next-After-Id of the previous page> over skip for
+    # paging; each page is then an index seek
+    tenants = await tenant_service.list_tenants(
+        db,
+        skip=skip,
+        limit=limit,
+        name_filter=name_filter,
+        is_active_filter=is_active_filter,
+        subscription_tier_filter=subscription_tier_filter,
+        after_id=after_id,
+    )
+    if len(tenants) == limit:
+        response.headers["X-Next-After-Id"] = str(tenants[-1].id)
+    return tenants
 
 
 @router.get("/{tenant_id}", response_model=TenantRead)
@@ -30,20 +79,71 @@ async def get_tenant(
     return tenant
 
 
-@router.get("/{tenant_id}/overview", response_model=TenantOverview)
-async def get_tenant_overview(
+@router.put("/{tenant_id}", response_model=TenantRead)
+async def update_tenant(
     tenant_id: int,
+    tenant: TenantUpdate,
     db: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user_dependency),
 ):
-    from agentprovision.core.models.tenant_model import Tenant
+    try:
+        updated = await tenant_service.update_tenant(db, tenant_id, tenant)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    # Evict only once the change is committed, so a concurrent overview
+    # request cannot re-cache the old row
+    _overview_cache.pop(tenant_id, None)
+    return updated
+
+
+@router.delete("/{tenant_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_tenant(
+    tenant_id: int,
+    db: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user_dependency),
+):
+    try:
+        await tenant_service.delete_tenant(db, tenant_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    _overview_cache.pop(tenant_id, None)
+    return None
 
-    tenant = await db.get(Tenant, tenant_id)
-    if not tenant:
-        raise HTTPException(status_code=404, detail="Tenant not found")
 
-    # Mock data for now
-    mock_stats = TenantStats(
+# --- Overview Cache ---
+# Dashboards poll the overview; serve each tenant's snapshot (tenant row
+# included) from memory for a few seconds instead of rebuilding it per call.
+_OVERVIEW_CACHE_TTL_SECONDS = 5
+_OVERVIEW_CACHE_MAXSIZE = 1024
+_overview_cache: "OrderedDict[int, tuple[float, TenantOverview]]" = OrderedDict()
+
+
+def _get_cached_overview(tenant_id: int) -> Optional[TenantOverview]:
+    entry = _overview_cache.get(tenant_id)
+    if entry is None:
+        return None
+    expires_at, overview = entry
+    if expires_at <= time.monotonic():
+        del _overview_cache[tenant_id]
+        return None
+    _overview_cache.move_to_end(tenant_id)
+    return overview
+
+
+def _cache_overview(tenant_id: int, overview: TenantOverview) -> None:
+    _overview_cache[tenant_id] = (
+        time.monotonic() + _OVERVIEW_CACHE_TTL_SECONDS,
+        overview,
+    )
+    _overview_cache.move_to_end(tenant_id)
+    if len(_overview_cache) > _OVERVIEW_CACHE_MAXSIZE:
+        _overview_cache.popitem(last=False)
+
+
+def _build_overview(tenant) -> TenantOverview:
+    # Mock data for now; the values are generated here, so the nested models
+    # are built with model_construct rather than validated field by field
+    mock_stats = TenantStats.model_construct(
         activeAgents=random.randint(5, 20),
         totalAgents=random.randint(20, 50),
         totalExecutions=random.randint(1000, 5000),
@@ -57,14 +157,16 @@ async def get_tenant_overview(
         "code_generator": random.randint(1, 5),
     }
 
+    now = datetime.utcnow()
+    statuses = random.choices(["completed", "failed", "running"], k=5)
     mock_recent_executions = [
-        RecentExecution(
+        RecentExecution.model_construct(
             _id=str(i),
-            _creationTime=datetime.utcnow() - timedelta(minutes=i * 15),
+            _creationTime=now - timedelta(minutes=i * 15),
             input=f"Test execution {i}",
-            status=random.choice(["completed", "failed", "running"]),
+            status=status,
         )
-        for i in range(5)
+        for i, status in enumerate(statuses)
     ]
 
     return TenantOverview(
@@ -73,3 +175,24 @@ async def get_tenant_overview(
         agentsByType=mock_agents_by_type,
         recentExecutions=mock_recent_executions,
     )
+
+
+@router.get("/{tenant_id}/overview", response_model=TenantOverview)
+async def get_tenant_overview(
+    tenant_id: int,
+    db: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user_dependency),
+):
+    overview = _get_cached_overview(tenant_id)
+    if overview is not None:
+        return overview
+
+    from agentprovision.core.models.tenant_model import Tenant
+
+    tenant = await db.get(Tenant, tenant_id)
+    if not tenant:
+        raise HTTPException(status_code=404, detail="Tenant not found")
+
+    overview = _build_overview(tenant)
+    _cache_overview(tenant_id, overview)
+    return overview
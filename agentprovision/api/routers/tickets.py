@@ -1,15 +1,29 @@
-from typing import List, Optional
+import asyncio
+import json
+import logging
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket
+from fastapi import (APIRouter, Depends, HTTPException, Query, WebSocket,
+                     WebSocketDisconnect)
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 
 from ...core.models import (AgentInteraction, AgentResponse, Ticket,
                             TicketFilter, TicketUpdate)
 from ...core.ticket_manager import TicketManager
 from ..dependencies import get_ticket_manager
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/tickets", tags=["tickets"])
 
 
+# Built once at import; list_tickets returns ready-made JSON, so the
+# response_model below only documents it
+_TICKETS = TypeAdapter(List[Ticket])
+
+
 @router.get("/", response_model=List[Ticket])
 async def list_tickets(
     filter: Optional[TicketFilter] = None,
@@ -19,7 +33,11 @@ async def list_tickets(
 ):
     """List tickets with optional filtering."""
     try:
-        return await ticket_manager.list_tickets(filter, skip, limit)
+        tickets = await ticket_manager.list_tickets(filter, skip, limit)
+        return Response(
+            _TICKETS.dump_json(_TICKETS.validate_python(tickets)),
+            media_type="application/json",
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -85,6 +103,170 @@ async def delete_ticket(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Client messages buffered per ticket before the reader stops reading
+_INBOX_SIZE = 16
+
+
+def _tag(ticket_id: str, message: str) -> str:
+    """Wrap a per-ticket JSON message in the shared socket's envelope."""
+    return f'{{"ticket_id": {json.dumps(ticket_id)}, "payload": {message}}}'
+
+
+def _untag(frame: str) -> Tuple[str, str]:
+    """Split a shared-socket frame into its ticket id and per-ticket message."""
+    data = json.loads(frame)
+    payload = data.get("payload")
+    if not isinstance(payload, str):
+        payload = json.dumps(payload)
+    return data.get("ticket_id"), payload
+
+
+async def _read_messages(
+    websocket: WebSocket,
+    inboxes: Dict[str, asyncio.Queue],
+    route: Callable[[str], Tuple[str, str]],
+    send: Callable[[Optional[str], str], Awaitable[None]],
+) -> None:
+    """Queue the client's messages per ticket until the connection ends."""
+    try:
+        while True:
+            frame = await websocket.receive_text()
+            try:
+                ticket_id, message = route(frame)
+            except (ValueError, AttributeError) as e:
+                # A malformed frame is the sender's problem, not a reason to
+                # end every conversation on the socket
+                await send(None, json.dumps({"error": f"Invalid message: {e}"}))
+                continue
+            inbox = inboxes.get(ticket_id)
+            if inbox is not None:
+                await inbox.put(message)
+    except WebSocketDisconnect:
+        # Consumers see reader.done()
+        pass
+
+
+async def _next_message(inbox: asyncio.Queue, reader: asyncio.Task) -> Optional[str]:
+    """Next queued client message, or None once the client has gone away."""
+    if inbox.empty() and not reader.done():
+        get = asyncio.create_task(inbox.get())
+        await asyncio.wait({get, reader}, return_when=asyncio.FIRST_COMPLETED)
+        if get.done():
+            return get.result()
+        get.cancel()
+    return None if inbox.empty() else inbox.get_nowait()
+
+
+async def _converse(
+    ticket_manager: TicketManager,
+    ticket: Ticket,
+    ticket_id: str,
+    inbox: asyncio.Queue,
+    reader: asyncio.Task,
+    send: Callable[[str], Awaitable[None]],
+) -> None:
+    """Run the agent conversation for one ticket until the client leaves."""
+    while (message := await _next_message(inbox, reader)) is not None:
+        interaction = AgentInteraction(ticket_id=ticket_id, user_message=message)
+
+        # Get agent response
+        response = await ticket_manager.get_agent_response(ticket, message)
+        interaction.response = response
+
+        # Send response to client, serialised straight to JSON by pydantic-core
+        await send(response.model_dump_json())
+
+        # If response requires approval, wait for it
+        if response.requires_approval:
+            reply = await _next_message(inbox, reader)
+            if reply is None:
+                break
+            try:
+                interaction.approved = json.loads(reply).get("approved", False)
+            except (ValueError, AttributeError) as e:
+                await send(json.dumps({"error": f"Invalid approval: {e}"}))
+                interaction.approved = False
+            if interaction.approved:
+                await ticket_manager.apply_agent_changes(ticket, response)
+
+        # Save interaction
+        await ticket_manager.add_interaction(ticket_id, interaction)
+
+
+async def _serve_tickets(
+    websocket: WebSocket,
+    ticket_manager: TicketManager,
+    tickets: Dict[str, Ticket],
+    route: Callable[[str], Tuple[str, str]],
+    send: Callable[[Optional[str], str], Awaitable[None]],
+) -> None:
+    """Hold the agent conversations for several tickets on one socket."""
+    # A single reader keeps draining the socket while the agents work; the
+    # bounded queues push back on clients that send too fast
+    inboxes = {ticket_id: asyncio.Queue(maxsize=_INBOX_SIZE) for ticket_id in tickets}
+    reader = asyncio.create_task(_read_messages(websocket, inboxes, route, send))
+    try:
+        await asyncio.gather(
+            *(
+                _converse(
+                    ticket_manager,
+                    ticket,
+                    ticket_id,
+                    inboxes[ticket_id],
+                    reader,
+                    partial(send, ticket_id),
+                )
+                for ticket_id, ticket in tickets.items()
+            )
+        )
+    finally:
+        reader.cancel()
+        for ticket_id in tickets:
+            # One failed flush must not skip the remaining tickets
+            try:
+                await ticket_manager.flush_interactions(ticket_id)
+            except Exception:
+                logger.exception(
+                    "Failed to flush interactions for ticket %s", ticket_id
+                )
+
+
+@router.websocket("/interact")
+async def interact_with_agents(
+    websocket: WebSocket,
+    ticket_manager: TicketManager = Depends(get_ticket_manager),
+):
+    """WebSocket endpoint for talking to the agent about several tickets.
+
+    The first client frame is {"subscribe": [ticket_id, ...]}. After that,
+    frames in both directions are {"ticket_id": ..., "payload": ...} where
+    payload is what the per-ticket endpoint would send or receive.
+    """
+    try:
+        await websocket.accept()
+        subscribe = json.loads(await websocket.receive_text())
+        tickets = {}
+        for ticket_id in subscribe.get("subscribe", []):
+            ticket = await ticket_manager.get_ticket(ticket_id)
+            if ticket:
+                tickets[ticket_id] = ticket
+            else:
+                await websocket.send_text(
+                    _tag(ticket_id, json.dumps({"error": "Ticket not found"}))
+                )
+        if not tickets:
+            await websocket.close(code=1000, reason="Ticket not found")
+            return
+
+        async def send(ticket_id: Optional[str], message: str) -> None:
+            await websocket.send_text(_tag(ticket_id, message))
+
+        await _serve_tickets(websocket, ticket_manager, tickets, _untag, send)
+
+    except Exception as e:
+        await websocket.close(code=1000, reason=str(e))
+
+
 @router.websocket("/{ticket_id}/interact")
 async def interact_with_agent(
     websocket: WebSocket,
@@ -99,26 +281,17 @@ async def interact_with_agent(
             await websocket.close(code=1000, reason="Ticket not found")
             return
 
-        while True:
-            message = await websocket.receive_text()
-            interaction = AgentInteraction(ticket_id=ticket_id, user_message=message)
-
-            # Get agent response
-            response = await ticket_manager.get_agent_response(ticket, message)
-            interaction.response = response
-
-            # Send response to client
-            await websocket.send_json(response.dict())
-
-            # If response requires approval, wait for it
-            if response.requires_approval:
-                approval = await websocket.receive_json()
-                interaction.approved = approval.get("approved", False)
-                if interaction.approved:
-                    await ticket_manager.apply_agent_changes(ticket, response)
+        async def send(_: Optional[str], message: str) -> None:
+            await websocket.send_text(message)
 
-            # Save interaction
-            await ticket_manager.add_interaction(ticket_id, interaction)
+        # Same hub as /interact, with one ticket and no envelope
+        await _serve_tickets(
+            websocket,
+            ticket_manager,
+            {ticket_id: ticket},
+            lambda message: (ticket_id, message),
+            send,
+        )
 
     except Exception as e:
         await websocket.close(code=1000, reason=str(e))
@@ -5,7 +5,7 @@ API routes for Chat Service.
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 
 from agentprovision.api.auth import get_current_user_dependency
@@ -218,8 +218,10 @@ async def list_available_tools(
 ):
     """List all available tools."""
     try:
-        tools = chat_service.tool_registry.list_tools()
-        return [tool.dict() for tool in tools]
+        return Response(
+            content=chat_service.tool_registry.list_tool_definitions_json(),
+            media_type="application/json",
+        )
 
     except Exception as e:
         raise HTTPException(
@@ -236,7 +238,7 @@ async def list_available_skills(
     """List all available skills."""
     try:
         skills = chat_service.skill_registry.list_skills()
-        return [skill.dict() for skill in skills]
+        return [skill.model_dump() for skill in skills]
 
     except Exception as e:
         raise HTTPException(
@@ -12,6 +12,7 @@ from agentprovision.core.database import get_session
 from agentprovision.core.models.user_model import User
 from agentprovision.core.services.llm_engine import (LLMEngine, LLMModel,
                                                      LLMRequest, LLMResponse,
+                                                     LLMScriptRequest,
                                                      LLMUsageMetrics,
                                                      get_llm_engine)
 
@@ -60,6 +61,33 @@ async def generate_text(
         )
 
 
+@router.post("/script", response_model=List[LLMResponse])
+async def generate_script(
+    script: LLMScriptRequest,
+    current_user: User = Depends(get_current_user_dependency),
+    llm_engine: LLMEngine = Depends(get_llm_engine),
+):
+    """Run a DAG of dependent LLM requests in a single roundtrip."""
+    if not current_user.tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User must be associated with a tenant",
+        )
+
+    for request in script.requests:
+        request.tenant_id = current_user.tenant_id
+
+    try:
+        return await llm_engine.generate_script(script.requests, script.deps)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to run script: {str(e)}",
+        )
+
+
 @router.get("/usage/{tenant_id}", response_model=Optional[LLMUsageMetrics])
 async def get_tenant_usage(
     tenant_id: int,
@@ -1,8 +1,13 @@
+import asyncio
+import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+import psutil
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from agentprovision.api.auth import get_current_user_dependency
 from agentprovision.core.models.monitoring_model import (Alert, CostMetrics,
@@ -11,6 +16,53 @@ from agentprovision.core.models.monitoring_model import (Alert, CostMetrics,
 router = APIRouter(prefix="/api/monitoring", tags=["monitoring"])
 
 
+# Seconds between pushes on /metrics/stream, and between recorded samples
+METRICS_STREAM_INTERVAL = 5
+
+# One hour of samples at the interval above
+_metrics_history: "deque[SystemMetrics]" = deque(maxlen=720)
+_last_net_io = (time.monotonic(), psutil.net_io_counters())
+# The first non-blocking cpu_percent() call only sets psutil's baseline
+psutil.cpu_percent()
+
+
+def _record_sample() -> SystemMetrics:
+    """Sample this host's resource usage with psutil and remember it."""
+    global _last_net_io
+    now, net_io = time.monotonic(), psutil.net_io_counters()
+    then, previous = _last_net_io
+    elapsed = max(now - then, 1e-6)
+    _last_net_io = (now, net_io)
+    sample = SystemMetrics(
+        cpu_usage=psutil.cpu_percent(),
+        memory_usage=psutil.virtual_memory().percent,
+        storage_usage=psutil.disk_usage("/").percent,
+        network_in=(net_io.bytes_recv - previous.bytes_recv) / elapsed / 1_000_000,
+        network_out=(net_io.bytes_sent - previous.bytes_sent) / elapsed / 1_000_000,
+    )
+    _metrics_history.append(sample)
+    return sample
+
+
+async def _fetch_system_metrics(
+    start_time: datetime, end_time: Optional[datetime] = None
+) -> List[SystemMetrics]:
+    """System metrics recorded after start_time, up to end_time (default: now)"""
+    # Samples are taken on demand, at most once per interval, so idle
+    # processes do no sampling work
+    latest = _metrics_history[-1] if _metrics_history else None
+    if latest is None or datetime.utcnow() - latest.timestamp >= timedelta(
+        seconds=METRICS_STREAM_INTERVAL
+    ):
+        _record_sample()
+    return [
+        sample
+        for sample in _metrics_history
+        if sample.timestamp > start_time
+        and (end_time is None or sample.timestamp <= end_time)
+    ]
+
+
 @router.get("/metrics", response_model=List[SystemMetrics])
 async def get_system_metrics(
     start_time: datetime = None,
@@ -20,10 +72,35 @@ async def get_system_metrics(
     """Get system metrics for a time period"""
     if not start_time:
         start_time = datetime.utcnow() - timedelta(hours=1)
-    if not end_time:
-        end_time = datetime.utcnow()
-    # TODO: Implement metrics retrieval
-    return []
+    return await _fetch_system_metrics(start_time, end_time)
+
+
+@router.get("/metrics/stream")
+async def stream_system_metrics(
+    request: Request,
+    current_user: dict = Depends(get_current_user_dependency),
+):
+    """Stream new system metrics as server-sent events (replaces polling /metrics)"""
+
+    async def events() -> AsyncIterator[str]:
+        since = datetime.utcnow() - timedelta(hours=1)
+        while not await request.is_disconnected():
+            rows = await _fetch_system_metrics(since)
+            for row in rows:
+                yield f"event: metric\ndata: {row.model_dump_json()}\n\n"
+            if rows:
+                since = rows[-1].timestamp
+            else:
+                # Comment line; keeps proxies from timing out an idle stream
+                yield ": keepalive\n\n"
+            await asyncio.sleep(METRICS_STREAM_INTERVAL)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # X-Accel-Buffering stops nginx-style proxies from holding frames back
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/alerts", response_model=List[Alert])
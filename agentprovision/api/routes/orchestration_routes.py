@@ -8,10 +8,10 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agentprovision.api.auth import get_current_user_dependency
+from agentprovision.api.services.tenant_service import get_cached_tenant
 from agentprovision.core.database import get_session
 from agentprovision.core.models.tenant_model import Tenant
 from agentprovision.core.models.user_model import User
@@ -22,6 +22,19 @@ from agentprovision.core.services.agent_orchestrator import (
 router = APIRouter()
 
 
+async def get_current_tenant(
+    current_user: User = Depends(get_current_user_dependency),
+    db: AsyncSession = Depends(get_session),
+) -> Tenant:
+    """Resolve the current user's tenant through the tenant cache."""
+    tenant = await get_cached_tenant(db, current_user.tenant_id)
+    if not tenant:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found"
+        )
+    return tenant
+
+
 class TaskSubmissionRequest(BaseModel):
     """Request model for task submission."""
 
@@ -76,37 +89,31 @@ class WorkflowResponse(BaseModel):
     message: str
 
 
+def _build_task(request: TaskSubmissionRequest, tenant_id: int) -> AgentTask:
+    """Create the orchestrator task for a submission request."""
+    return AgentTask(
+        tenant_id=tenant_id,
+        agent_type=request.agent_type,
+        task_type=request.task_type,
+        priority=request.priority,
+        payload=request.payload,
+        timeout_seconds=request.timeout_seconds,
+        max_retries=request.max_retries,
+        dependencies=request.dependencies,
+        metadata=request.metadata,
+    )
+
+
 @router.post("/orchestration/tasks", response_model=TaskResponse)
 async def submit_task(
     request: TaskSubmissionRequest,
-    current_user: User = Depends(get_current_user_dependency),
+    tenant: Tenant = Depends(get_current_tenant),
     orchestrator: AgentOrchestrator = Depends(get_orchestrator),
-    db: AsyncSession = Depends(get_session),
 ):
     """Submit a new task for execution."""
     try:
-        # Get user's tenant
-        result = await db.execute(
-            select(Tenant).where(Tenant.id == current_user.tenant_id)
-        )
-        tenant = result.scalars().first()
-        if not tenant:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found"
-            )
-
         # Create task
-        task = AgentTask(
-            tenant_id=tenant.id,
-            agent_type=request.agent_type,
-            task_type=request.task_type,
-            priority=request.priority,
-            payload=request.payload,
-            timeout_seconds=request.timeout_seconds,
-            max_retries=request.max_retries,
-            dependencies=request.dependencies,
-            metadata=request.metadata,
-        )
+        task = _build_task(request, tenant.id)
 
         # Submit task
         task_id = await orchestrator.submit_task(task)
@@ -124,25 +131,41 @@ async def submit_task(
         )
 
 
+@router.post("/orchestration/tasks:batch", response_model=List[TaskResponse])
+async def submit_tasks(
+    requests: List[TaskSubmissionRequest],
+    tenant: Tenant = Depends(get_current_tenant),
+    orchestrator: AgentOrchestrator = Depends(get_orchestrator),
+):
+    """Submit several tasks in one request (all or none are queued)."""
+    try:
+        tasks = [_build_task(request, tenant.id) for request in requests]
+        task_ids = await orchestrator.submit_tasks_bulk(tasks)
+
+        return [
+            TaskResponse(
+                task_id=str(task_id),
+                status="submitted",
+                message="Task submitted successfully",
+            )
+            for task_id in task_ids
+        ]
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to submit tasks: {str(e)}",
+        )
+
+
 @router.post("/orchestration/workflows", response_model=WorkflowResponse)
 async def submit_workflow(
     request: WorkflowSubmissionRequest,
-    current_user: User = Depends(get_current_user_dependency),
+    tenant: Tenant = Depends(get_current_tenant),
     orchestrator: AgentOrchestrator = Depends(get_orchestrator),
-    db: AsyncSession = Depends(get_session),
 ):
     """Submit a new workflow for execution."""
     try:
-        # Get user's tenant
-        result = await db.execute(
-            select(Tenant).where(Tenant.id == current_user.tenant_id)
-        )
-        tenant = result.scalars().first()
-        if not tenant:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found"
-            )
-
         # Create workflow
         workflow = WorkflowDefinition(
             name=request.name,
@@ -223,22 +246,11 @@ async def cancel_task(
 
 @router.get("/orchestration/agents")
 async def get_tenant_agents(
-    current_user: User = Depends(get_current_user_dependency),
+    tenant: Tenant = Depends(get_current_tenant),
     orchestrator: AgentOrchestrator = Depends(get_orchestrator),
-    db: AsyncSession = Depends(get_session),
 ):
     """Get all agents for the current tenant with their status."""
     try:
-        # Get user's tenant
-        result = await db.execute(
-            select(Tenant).where(Tenant.id == current_user.tenant_id)
-        )
-        tenant = result.scalars().first()
-        if not tenant:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found"
-            )
-
         agents = await orchestrator.get_tenant_agents(tenant.id)
         return {"agents": agents}
 
@@ -355,65 +367,43 @@ async def resume_agent(
 
 @router.get("/orchestration/metrics")
 async def get_orchestration_metrics(
-    current_user: User = Depends(get_current_user_dependency),
+    tenant: Tenant = Depends(get_current_tenant),
     orchestrator: AgentOrchestrator = Depends(get_orchestrator),
-    db: AsyncSession = Depends(get_session),
 ):
     """Get orchestration metrics for the current tenant."""
     try:
-        # Get user's tenant
-        result = await db.execute(
-            select(Tenant).where(Tenant.id == current_user.tenant_id)
-        )
-        tenant = result.scalars().first()
-        if not tenant:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found"
-            )
-
-        # Get agents for tenant
-        agents = await orchestrator.get_tenant_agents(tenant.id)
-
-        # Calculate metrics
-        total_agents = len(agents)
-        active_agents = len([a for a in agents if a["is_active"]])
-        healthy_agents = len([a for a in agents if a["is_healthy"]])
-        total_current_tasks = sum(a["current_tasks"] for a in agents)
-        total_max_tasks = sum(a["max_concurrent_tasks"] for a in agents)
-
-        # Task queue metrics
-        total_queued_tasks = sum(
-            len(queue) for queue in orchestrator.task_queue.values()
-        )
-        total_running_tasks = len(orchestrator.running_tasks)
+        snapshot = await orchestrator.snapshot(tenant.id)
+        queued = snapshot.queued_tasks
 
         # Calculate utilization
         utilization = (
-            (total_current_tasks / total_max_tasks * 100) if total_max_tasks > 0 else 0
+            (snapshot.current_tasks / snapshot.max_tasks * 100)
+            if snapshot.max_tasks > 0
+            else 0
         )
 
         return {
             "tenant_id": tenant.id,
             "agents": {
-                "total": total_agents,
-                "active": active_agents,
-                "healthy": healthy_agents,
+                "total": snapshot.total_agents,
+                "active": snapshot.active_agents,
+                "healthy": snapshot.healthy_agents,
                 "utilization_percent": round(utilization, 2),
             },
             "tasks": {
-                "queued": total_queued_tasks,
-                "running": total_running_tasks,
+                "queued": sum(queued.values()),
+                "running": snapshot.running_tasks,
                 "queue_breakdown": {
-                    "critical": len(orchestrator.task_queue[TaskPriority.CRITICAL]),
-                    "high": len(orchestrator.task_queue[TaskPriority.HIGH]),
-                    "normal": len(orchestrator.task_queue[TaskPriority.NORMAL]),
-                    "low": len(orchestrator.task_queue[TaskPriority.LOW]),
+                    "critical": queued[TaskPriority.CRITICAL],
+                    "high": queued[TaskPriority.HIGH],
+                    "normal": queued[TaskPriority.NORMAL],
+                    "low": queued[TaskPriority.LOW],
                 },
             },
             "capacity": {
-                "current_tasks": total_current_tasks,
-                "max_tasks": total_max_tasks,
-                "available_capacity": total_max_tasks - total_current_tasks,
+                "current_tasks": snapshot.current_tasks,
+                "max_tasks": snapshot.max_tasks,
+                "available_capacity": snapshot.max_tasks - snapshot.current_tasks,
             },
             "timestamp": datetime.utcnow(),
         }
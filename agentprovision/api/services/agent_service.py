@@ -1,24 +1,22 @@
-from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
 from agentprovision.api.schemas.agent import AgentCreate, AgentUpdate
 from agentprovision.core.models.agent_model import Agent
 
 
 async def create_agent(db: AsyncSession, agent_in: AgentCreate) -> Agent:
-    agent = Agent(**agent_in.dict())
+    agent = Agent(**agent_in.model_dump())
     db.add(agent)
     await db.commit()
-    await db.refresh(agent)
     return agent
 
 
 async def get_agent(db: AsyncSession, agent_id: int) -> Optional[Agent]:
-    result = await db.execute(select(Agent).where(Agent.id == agent_id))
-    return result.scalar_one_or_none()
+    # Primary-key lookup: served from the session's identity map when loaded
+    return await db.get(Agent, agent_id)
 
 
 async def list_agents(db: AsyncSession) -> List[Agent]:
@@ -27,14 +25,35 @@ async def list_agents(db: AsyncSession) -> List[Agent]:
 
 
 async def update_agent(db: AsyncSession, agent_id: int, agent_in: AgentUpdate) -> Agent:
-    agent = await get_agent(db, agent_id)
+    changes = agent_in.model_dump(exclude_unset=True)
+    if not changes:
+        agent = await get_agent(db, agent_id)
+        if not agent:
+            raise ValueError("Agent not found")
+        return agent
+
+    # One UPDATE ... RETURNING round trip instead of a SELECT then an UPDATE
+    # (updated_at is set by the database through the column's onupdate);
+    # populate_existing refreshes any copy already in the session. Dialects
+    # without UPDATE ... RETURNING (SQLite on SQLAlchemy 1.4) re-read the row.
+    stmt = update(Agent).where(Agent.id == agent_id).values(**changes)
+    if db.get_bind().dialect.full_returning:
+        result = await db.execute(
+            select(Agent)
+            .from_statement(stmt.returning(*Agent.__table__.c))
+            .execution_options(populate_existing=True)
+        )
+        agent = result.scalars().first()
+    else:
+        result = await db.execute(stmt)
+        agent = (
+            await db.get(Agent, agent_id, populate_existing=True)
+            if result.rowcount
+            else None
+        )
     if not agent:
         raise ValueError("Agent not found")
-    for field, value in agent_in.dict(exclude_unset=True).items():
-        setattr(agent, field, value)
-    agent.updated_at = datetime.utcnow()
     await db.commit()
-    await db.refresh(agent)
     return agent
 
 
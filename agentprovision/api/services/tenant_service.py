@@ -1,9 +1,10 @@
-from datetime import datetime
-from typing import List, Optional
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
 
-from sqlalchemy import and_
+from sqlalchemy import and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
 from agentprovision.api.schemas.tenant import TenantCreate, TenantUpdate
 from agentprovision.core.models.tenant_model import Tenant
@@ -12,7 +13,7 @@ from agentprovision.core.models.tenant_model import Tenant
 async def create_tenant(db: AsyncSession, tenant_in: TenantCreate) -> Tenant:
     # Ensure slug is provided or generated if not part of TenantCreate
     # For now, assuming TenantCreate includes slug as per schema
-    tenant_data = tenant_in.dict()
+    tenant_data = tenant_in.model_dump()
     if not tenant_data.get("slug"):  # Basic slug generation if not provided
         tenant_data["slug"] = (
             tenant_data["name"].lower().replace(" ", "-").replace("_", "-")
@@ -21,13 +22,75 @@ async def create_tenant(db: AsyncSession, tenant_in: TenantCreate) -> Tenant:
     tenant = Tenant(**tenant_data)
     db.add(tenant)
     await db.commit()
-    await db.refresh(tenant)
     return tenant
 
 
 async def get_tenant(db: AsyncSession, tenant_id: int) -> Optional[Tenant]:
-    result = await db.execute(select(Tenant).where(Tenant.id == tenant_id))
-    return result.scalar_one_or_none()
+    # Primary-key lookup: served from the session's identity map when loaded
+    return await db.get(Tenant, tenant_id)
+
+
+# --- Tenant Cache ---
+# Every orchestration request resolves the caller's tenant; the row rarely
+# changes, so its columns are kept in memory for a minute (and dropped on
+# update/delete). Concurrent misses for one tenant share a single query; the
+# per-tenant lock only lives while requests are waiting on it.
+_TENANT_CACHE_TTL_SECONDS = 60
+_TENANT_CACHE_MAXSIZE = 10_000
+_tenant_cache: "OrderedDict[int, tuple[float, dict]]" = OrderedDict()
+# tenant id -> [lock, number of requests holding or waiting on it]
+_tenant_locks: Dict[int, list] = {}
+
+
+def _get_cached_tenant(tenant_id: int) -> Optional[Tenant]:
+    entry = _tenant_cache.get(tenant_id)
+    if entry is None:
+        return None
+    expires_at, columns = entry
+    if expires_at <= time.monotonic():
+        del _tenant_cache[tenant_id]
+        return None
+    _tenant_cache.move_to_end(tenant_id)
+    return Tenant(**columns)
+
+
+def _cache_tenant(tenant: Tenant) -> None:
+    columns = {column.key: getattr(tenant, column.key) for column in Tenant.__table__.c}
+    _tenant_cache[tenant.id] = (
+        time.monotonic() + _TENANT_CACHE_TTL_SECONDS,
+        columns,
+    )
+    _tenant_cache.move_to_end(tenant.id)
+    if len(_tenant_cache) > _TENANT_CACHE_MAXSIZE:
+        _tenant_cache.popitem(last=False)
+
+
+def invalidate_cached_tenant(tenant_id: int) -> None:
+    """Drop a cached tenant after it is updated or deleted."""
+    _tenant_cache.pop(tenant_id, None)
+
+
+async def get_cached_tenant(db: AsyncSession, tenant_id: int) -> Optional[Tenant]:
+    """Tenant by id, from the in-process cache when fresh (detached copy)."""
+    tenant = _get_cached_tenant(tenant_id)
+    if tenant is None:
+        entry = _tenant_locks.get(tenant_id)
+        if entry is None:
+            entry = _tenant_locks[tenant_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                # Another request may have loaded it while we waited
+                tenant = _get_cached_tenant(tenant_id)
+                if tenant is None:
+                    tenant = await get_tenant(db, tenant_id)
+                    if tenant is not None:
+                        _cache_tenant(tenant)
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del _tenant_locks[tenant_id]
+    return tenant
 
 
 async def list_tenants(
@@ -37,7 +100,13 @@ async def list_tenants(
     name_filter: Optional[str] = None,
     is_active_filter: Optional[bool] = None,
     subscription_tier_filter: Optional[str] = None,
+    after_id: Optional[int] = None,
 ) -> List[Tenant]:
+    """
+    Tenants in id order. Pass the last id of the previous page as after_id
+    (keyset pagination) instead of a growing skip: the database seeks
+    straight to the page instead of scanning and discarding skip rows.
+    """
     query = select(Tenant)
     conditions = []
     if name_filter:
@@ -46,11 +115,16 @@ async def list_tenants(
         conditions.append(Tenant.is_active == is_active_filter)
     if subscription_tier_filter:
         conditions.append(Tenant.subscription_tier == subscription_tier_filter)
+    if after_id is not None:
+        conditions.append(Tenant.id > after_id)
 
     if conditions:
         query = query.where(and_(*conditions))
 
-    query = query.offset(skip).limit(limit)
+    query = query.order_by(Tenant.id)
+    if skip:
+        query = query.offset(skip)
+    query = query.limit(limit)
     result = await db.execute(query)
     return result.scalars().all()
 
@@ -58,14 +132,36 @@ async def list_tenants(
 async def update_tenant(
     db: AsyncSession, tenant_id: int, tenant_in: TenantUpdate
 ) -> Tenant:
-    tenant = await get_tenant(db, tenant_id)
+    changes = tenant_in.model_dump(exclude_unset=True)
+    if not changes:
+        tenant = await get_tenant(db, tenant_id)
+        if not tenant:
+            raise ValueError("Tenant not found")
+        return tenant
+
+    # One UPDATE ... RETURNING round trip instead of a SELECT then an UPDATE
+    # (updated_at is set by the database through the column's onupdate);
+    # populate_existing refreshes any copy already in the session. Dialects
+    # without UPDATE ... RETURNING (SQLite on SQLAlchemy 1.4) re-read the row.
+    stmt = update(Tenant).where(Tenant.id == tenant_id).values(**changes)
+    if db.get_bind().dialect.full_returning:
+        result = await db.execute(
+            select(Tenant)
+            .from_statement(stmt.returning(*Tenant.__table__.c))
+            .execution_options(populate_existing=True)
+        )
+        tenant = result.scalars().first()
+    else:
+        result = await db.execute(stmt)
+        tenant = (
+            await db.get(Tenant, tenant_id, populate_existing=True)
+            if result.rowcount
+            else None
+        )
     if not tenant:
         raise ValueError("Tenant not found")
-    for field, value in tenant_in.dict(exclude_unset=True).items():
-        setattr(tenant, field, value)
-    tenant.updated_at = datetime.utcnow()
     await db.commit()
-    await db.refresh(tenant)
+    invalidate_cached_tenant(tenant_id)
     return tenant
 
 
@@ -75,3 +171,4 @@ async def delete_tenant(db: AsyncSession, tenant_id: int) -> None:
         raise ValueError("Tenant not found")
     await db.delete(tenant)
     await db.commit()
+    invalidate_cached_tenant(tenant_id)
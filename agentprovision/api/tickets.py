@@ -7,19 +7,21 @@ from typing import Any, Dict, List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from agentprovision.core.database import get_session
 from agentprovision.core.ticket_engine.engine import TicketEngine
-from agentprovision.core.ticket_engine.models import Requirement, Ticket
+from agentprovision.core.ticket_engine.models import (
+    Ticket, TicketWithRequirementsResponse)
 
 router = APIRouter(prefix="/tickets", tags=["tickets"])
 ticket_engine = TicketEngine()
 
 
-@router.post("/", response_model=Dict[str, Any])
+@router.post("/", response_model=TicketWithRequirementsResponse)
 async def create_ticket(
     ticket_data: Dict[str, Any], db: AsyncSession = Depends(get_session)
-) -> Dict[str, Any]:
+) -> TicketWithRequirementsResponse:
     """
     Create a new ticket from Jira data.
 
@@ -51,10 +53,10 @@ async def create_ticket(
         raise HTTPException(status_code=500, detail=f"Error creating ticket: {str(e)}")
 
 
-@router.get("/{ticket_key}", response_model=Dict[str, Any])
+@router.get("/{ticket_key}", response_model=TicketWithRequirementsResponse)
 async def get_ticket(
     ticket_key: str, db: AsyncSession = Depends(get_session)
-) -> Dict[str, Any]:
+) -> TicketWithRequirementsResponse:
     """
     Get a ticket by its key.
 
@@ -65,24 +67,25 @@ async def get_ticket(
     Returns:
         Dict containing the ticket and its requirements
     """
-    # Query ticket
-    stmt = select(Ticket).where(Ticket.key == ticket_key)
+    # Query ticket, with its requirements loaded alongside
+    stmt = (
+        select(Ticket)
+        .where(Ticket.key == ticket_key)
+        .options(selectinload(Ticket.requirements))
+    )
     result = await db.execute(stmt)
     ticket = result.scalars().first()
 
     if not ticket:
         raise HTTPException(status_code=404, detail=f"Ticket {ticket_key} not found")
 
-    # Query requirements
-    req_stmt = select(Requirement).where(Requirement.ticket_id == ticket.id)
-    req_result = await db.execute(req_stmt)
-    requirements = req_result.scalars().all()
+    return {"ticket": ticket, "requirements": ticket.requirements}
 
-    return {"ticket": ticket, "requirements": requirements}
 
-
-@router.get("/", response_model=List[Dict[str, Any]])
-async def list_tickets(db: AsyncSession = Depends(get_session)) -> List[Dict[str, Any]]:
+@router.get("/", response_model=List[TicketWithRequirementsResponse])
+async def list_tickets(
+    db: AsyncSession = Depends(get_session),
+) -> List[TicketWithRequirementsResponse]:
     """
     List all tickets.
 
@@ -92,16 +95,12 @@ async def list_tickets(db: AsyncSession = Depends(get_session)) -> List[Dict[str
     Returns:
         List of tickets with their requirements
     """
-    stmt = select(Ticket)
+    # One IN query loads every ticket's requirements, not one query per ticket
+    stmt = select(Ticket).options(selectinload(Ticket.requirements))
     result = await db.execute(stmt)
     tickets = result.scalars().all()
 
-    response_list = []
-
-    for ticket_item in tickets:
-        req_stmt = select(Requirement).where(Requirement.ticket_id == ticket_item.id)
-        req_result = await db.execute(req_stmt)
-        requirements = req_result.scalars().all()
-        response_list.append({"ticket": ticket_item, "requirements": requirements})
-
-    return response_list
+    return [
+        {"ticket": ticket_item, "requirements": ticket_item.requirements}
+        for ticket_item in tickets
+    ]
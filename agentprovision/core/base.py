@@ -1,3 +1,28 @@
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql.expression import FunctionElement
 
 Base = declarative_base()
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database.
+
+    Matches the naive UTC values datetime.utcnow writes, whatever the
+    database session's time zone is.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
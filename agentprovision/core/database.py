@@ -5,11 +5,13 @@ Database configuration and session management.
 import asyncio
 import logging
 import os
+from functools import lru_cache
 from typing import AsyncGenerator
 
 # Removed global engine and session factory to ensure settings are always from get_settings()
 # from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    create_async_engine)
 # from sqlalchemy.ext.declarative import declarative_base # Redundant import
 from sqlalchemy.orm import declarative_base, sessionmaker
 
@@ -24,32 +26,57 @@ from agentprovision.core.models.tenant_model import Tenant
 logger = logging.getLogger(__name__)
 
 # Removed global DATABASE_URL, ASYNC_DATABASE_URL, engine, async_session_factory
-# These will now be created dynamically within functions using get_settings()
+# The engine is now created lazily (once) by get_engine() using get_settings()
 
 # Create base class for models
 Base = declarative_base()
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
+@lru_cache()
+def get_engine() -> AsyncEngine:
     """
-    Dependency for getting async database sessions.
+    Get the process-wide async engine, built once from get_settings().
+
+    Every session shares this engine's connection pool, so requests reuse
+    warm asyncpg connections instead of opening a new pool each time.
     """
     settings = get_settings()
     # Construct async URL from settings
     async_db_url = settings.DATABASE_URL.replace(
         "postgresql://", "postgresql+asyncpg://"
     )
-    engine = create_async_engine(
+    return create_async_engine(
         async_db_url,
         echo=settings.DATABASE_ECHO,
         pool_size=settings.DATABASE_POOL_SIZE,
         max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        connect_args={
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE
+        },
     )
-    AsyncSessionLocal = sessionmaker(
-        bind=engine,
+
+
+@lru_cache()
+def get_session_factory() -> sessionmaker:
+    """
+    Get the session factory bound to the shared engine.
+    """
+    return sessionmaker(
+        bind=get_engine(),
         class_=AsyncSession,
+        # Objects stay loaded after commit, so callers can return them
+        # without a refresh() round-trip
         expire_on_commit=False,
     )
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting async database sessions.
+    """
+    AsyncSessionLocal = get_session_factory()
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -65,20 +92,10 @@ async def init_db():
     """
     Initialize the database, creating all tables.
     """
-    settings = get_settings()
-    # Construct async URL from settings
-    async_db_url = settings.DATABASE_URL.replace(
-        "postgresql://", "postgresql+asyncpg://"
-    )
+    engine = get_engine()
     logger.info(
-        f"Attempting to connect to database with URL: {async_db_url}"
-    )  # Log the URL
-    engine = create_async_engine(
-        async_db_url,
-        echo=settings.DATABASE_ECHO,
-        pool_size=settings.DATABASE_POOL_SIZE,
-        max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    )
+        f"Attempting to connect to database with URL: {engine.url!r}"
+    )  # Log the URL (password masked)
 
     max_retries = 5
     retry_delay = 5  # seconds
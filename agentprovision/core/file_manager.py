@@ -1,18 +1,24 @@
 import asyncio
 import mimetypes
+import mmap
 import os
 import re
 import shutil
 import time
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import aiofiles
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.api import ObservedWatch
 
 from .config import settings
 
+# Files at least this large are read through mmap instead of buffered reads
+MMAP_READ_THRESHOLD = 64 * 1024
+
 
 class FileChangeHandler(FileSystemEventHandler):
     def __init__(self, callback: Callable[[str, str], None]):
@@ -92,9 +98,12 @@ class FileManager:
             ".lock",
             ".log",
         }
+        # One observer (a single inotify/kqueue/FSEvents backend) serves every
+        # watched path; each path gets one watch, shared by its subscribers
         self.observer = None
-        self.watched_paths: Set[str] = set()
+        self.watched_paths: Dict[str, ObservedWatch] = {}
         self.change_callbacks: Dict[str, List[Callable[[str, str], None]]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def watch_directory(
         self, path: str, callback: Callable[[str, str], None]
@@ -109,19 +118,19 @@ class FileManager:
                 raise ValueError(f"Path is not a directory: {path}")
 
             str_path = str(watch_path)
-            if str_path not in self.change_callbacks:
-                self.change_callbacks[str_path] = []
-
-            self.change_callbacks[str_path].append(callback)
+            self.change_callbacks.setdefault(str_path, []).append(callback)
 
             if str_path not in self.watched_paths:
                 if self.observer is None:
                     self.observer = Observer()
                     self.observer.start()
 
-                handler = FileChangeHandler(lambda p, e: self._notify_callbacks(p, e))
-                self.observer.schedule(handler, str_path, recursive=True)
-                self.watched_paths.add(str_path)
+                # Events arrive on the observer thread; hop back to this loop
+                self._loop = asyncio.get_running_loop()
+                handler = FileChangeHandler(partial(self._dispatch_change, str_path))
+                self.watched_paths[str_path] = self.observer.schedule(
+                    handler, str_path, recursive=True
+                )
 
         except Exception as e:
             raise Exception(f"Error watching directory: {str(e)}")
@@ -142,11 +151,11 @@ class FileManager:
                 else:
                     del self.change_callbacks[str_path]
 
+                # Drop only this path's watch once its last subscriber leaves
                 if str_path in self.watched_paths and not self.change_callbacks.get(
                     str_path
                 ):
-                    self.observer.unschedule_all()
-                    self.watched_paths.remove(str_path)
+                    self.observer.unschedule(self.watched_paths.pop(str_path))
 
                     if not self.watched_paths and self.observer:
                         self.observer.stop()
@@ -155,14 +164,19 @@ class FileManager:
         except Exception as e:
             raise Exception(f"Error unwatching directory: {str(e)}")
 
-    def _notify_callbacks(self, path: str, event_type: str) -> None:
-        """Notify all callbacks about a file change."""
+    def _dispatch_change(self, watch_path: str, path: str, event_type: str) -> None:
+        """Forward a change from the observer thread to the event loop."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(
+                self._notify_callbacks, watch_path, path, event_type
+            )
+
+    def _notify_callbacks(self, watch_path: str, path: str, event_type: str) -> None:
+        """Notify the callbacks subscribed to a watched path about a change."""
         try:
             relative_path = str(Path(path).relative_to(self.base_path))
-            for watch_path, callbacks in self.change_callbacks.items():
-                if relative_path.startswith(watch_path):
-                    for callback in callbacks:
-                        asyncio.create_task(callback(relative_path, event_type))
+            for callback in list(self.change_callbacks.get(watch_path, ())):
+                asyncio.create_task(callback(relative_path, event_type))
         except Exception as e:
             print(f"Error notifying callbacks: {str(e)}")
 
@@ -171,27 +185,22 @@ class FileManager:
     ) -> Dict[str, List[str]]:
         """Compare two files and return their differences."""
         try:
-            content1, _ = await self.read_file(file1_path)
-            content2, _ = await self.read_file(file2_path)
+            (content1, _), (content2, _) = await asyncio.gather(
+                self.read_file(file1_path), self.read_file(file2_path)
+            )
 
             lines1 = content1.splitlines()
             lines2 = content2.splitlines()
 
-            added = []
-            removed = []
-            modified = []
-
-            # Find added and modified lines
-            for i, line in enumerate(lines2):
-                if i >= len(lines1):
-                    added.append(line)
-                elif line != lines1[i]:
-                    modified.append(f"Line {i + 1}: {lines1[i]} -> {line}")
-
-            # Find removed lines
-            for i, line in enumerate(lines1):
-                if i >= len(lines2):
-                    removed.append(line)
+            # Line-by-line by position: the shared prefix is compared in one
+            # zip pass and whatever is past the shorter file is sliced off
+            modified = [
+                f"Line {i}: {old} -> {new}"
+                for i, (old, new) in enumerate(zip(lines1, lines2), start=1)
+                if old != new
+            ]
+            added = lines2[len(lines1) :]
+            removed = lines1[len(lines2) :]
 
             return {"added": added, "removed": removed, "modified": modified}
         except Exception as e:
@@ -199,56 +208,135 @@ class FileManager:
 
     async def list_files(self, path: str = "") -> List[dict]:
         """List files and directories in the specified path."""
+        nodes, _ = await self.list_files_stamped(path)
+        return nodes
+
+    async def list_files_stamped(
+        self, path: str = ""
+    ) -> Tuple[List[dict], Tuple[Tuple[str, int], ...]]:
+        """
+        List a path along with the mtime of every directory in the listing.
+
+        A listing only depends on entry names and types, which change exactly
+        when some directory's mtime does, so listing_unchanged(stamps) tells
+        whether a cached copy of the listing is still current.
+        """
         try:
             full_path = self.base_path / path
             if not full_path.exists():
                 raise FileNotFoundError(f"Path not found: {path}")
 
-            result = []
-            for item in full_path.iterdir():
-                if item.is_file() and item.suffix not in self.allowed_extensions:
+            # Walk the whole tree in one worker thread instead of hopping back
+            # to the event loop for every subdirectory
+            relative_root = str(full_path.relative_to(self.base_path))
+            stamps: List[Tuple[str, int]] = []
+            nodes = await asyncio.to_thread(
+                self._scan_tree, str(full_path), relative_root, stamps
+            )
+            return nodes, tuple(stamps)
+        except Exception as e:
+            raise Exception(f"Error listing files: {str(e)}")
+
+    async def listing_unchanged(self, stamps: Tuple[Tuple[str, int], ...]) -> bool:
+        """Whether no directory recorded by list_files_stamped has changed."""
+        return await asyncio.to_thread(self._stamps_current, stamps)
+
+    @staticmethod
+    def _stamps_current(stamps: Tuple[Tuple[str, int], ...]) -> bool:
+        """Re-stat the recorded directories (blocking; no directory reads)."""
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in stamps)
+        except OSError:
+            return False
+
+    def _scan_tree(
+        self, dir_path: str, relative_dir: str, stamps: List[Tuple[str, int]]
+    ) -> List[dict]:
+        """Build the file tree for a directory (blocking)."""
+        # Stat before reading, so a change made during the read bumps the
+        # mtime past the recorded one
+        stamps.append((dir_path, os.stat(dir_path).st_mtime_ns))
+        result = []
+        # scandir entries carry the file type from the directory read itself,
+        # so this avoids a stat() call per entry
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if (
+                    entry.is_file()
+                    and os.path.splitext(entry.name)[1] not in self.allowed_extensions
+                ):
                     continue
+                is_dir = entry.is_dir()
 
+                relative_path = (
+                    entry.name
+                    if relative_dir == "."
+                    else os.path.join(relative_dir, entry.name)
+                )
                 node = {
-                    "name": item.name,
-                    "type": "directory" if item.is_dir() else "file",
-                    "path": str(item.relative_to(self.base_path)),
+                    "name": entry.name,
+                    "type": "directory" if is_dir else "file",
+                    "path": relative_path,
                 }
 
-                if item.is_dir():
-                    node["children"] = await self.list_files(
-                        str(item.relative_to(self.base_path))
+                if is_dir:
+                    node["children"] = self._scan_tree(
+                        entry.path, relative_path, stamps
                     )
 
                 result.append(node)
 
-            return sorted(
-                result, key=lambda x: (x["type"] == "file", x["name"].lower())
-            )
-        except Exception as e:
-            raise Exception(f"Error listing files: {str(e)}")
+        return sorted(result, key=lambda x: (x["type"] == "file", x["name"].lower()))
+
+    def resolve_readable_file(self, file_path: str) -> Path:
+        """Return the full path of a file that may be read, or raise."""
+        full_path = self.base_path / file_path
+        if not full_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        if not full_path.is_file():
+            raise ValueError(f"Path is not a file: {file_path}")
+
+        if full_path.suffix not in self.allowed_extensions:
+            raise ValueError(f"File type not allowed: {file_path}")
+
+        return full_path
+
+    def raw_file_info(self, file_path: str) -> Tuple[Path, str, str]:
+        """Return a readable file's full path, media type and language."""
+        full_path = self.resolve_readable_file(file_path)
+        media_type = mimetypes.guess_type(full_path.name)[0] or "text/plain"
+        return full_path, media_type, self._detect_language(file_path)
 
     async def read_file(self, file_path: str) -> Tuple[str, str]:
         """Read the content of a file and detect its language."""
         try:
-            full_path = self.base_path / file_path
-            if not full_path.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
-
-            if not full_path.is_file():
-                raise ValueError(f"Path is not a file: {file_path}")
-
-            if full_path.suffix not in self.allowed_extensions:
-                raise ValueError(f"File type not allowed: {file_path}")
+            full_path = self.resolve_readable_file(file_path)
 
-            async with aiofiles.open(full_path, "r", encoding="utf-8") as f:
-                content = await f.read()
+            if full_path.stat().st_size >= MMAP_READ_THRESHOLD:
+                content = await asyncio.to_thread(self._read_mapped, full_path)
+            else:
+                async with aiofiles.open(full_path, "r", encoding="utf-8") as f:
+                    content = await f.read()
 
             language = self._detect_language(file_path)
             return content, language
         except Exception as e:
             raise Exception(f"Error reading file: {str(e)}")
 
+    @staticmethod
+    def _read_mapped(full_path: Path) -> str:
+        """Decode a large file straight from a read-only memory map (blocking)."""
+        with open(full_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                content = str(mm, "utf-8")
+        # Match text-mode reads, which translate universal newlines
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
     async def write_file(self, file_path: str, content: str) -> None:
         """Write content to a file."""
         try:
@@ -393,83 +481,114 @@ class FileManager:
         except Exception as e:
             raise Exception(f"Error moving file: {str(e)}")
 
+    def _list_searchable_files(self, root: Path) -> List[Tuple[str, str]]:
+        """(path, name) of every allowed file under root (blocking)."""
+        files = []
+        # Iterative scandir walk: entry types come from the directory read,
+        # so there is no stat() per entry and no recursion per directory
+        pending = [str(root)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        if os.path.splitext(entry.name)[1] in self.allowed_extensions:
+                            files.append((entry.path, entry.name))
+                    elif entry.is_dir():
+                        pending.append(entry.path)
+        return files
+
+    def _grep_files(
+        self, files: List[Tuple[str, str]], pattern: re.Pattern
+    ) -> List[Dict[str, str]]:
+        """Search result for each of files whose content matches (blocking)."""
+        matches = []
+        for file_path, name in files:
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    if pattern.search(f.read()):
+                        matches.append(
+                            {
+                                "path": os.path.relpath(file_path, self.base_path),
+                                "name": name,
+                                "type": "file",
+                            }
+                        )
+            except Exception:
+                # Skip files that can't be read
+                pass
+        return matches
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _compile_patterns(
+        patterns: Tuple[str, ...], case_sensitive: bool
+    ) -> "re.Pattern[str]":
+        # One alternation scans each text once for every pattern, and
+        # IGNORECASE avoids lower-casing a full copy of every file
+        flags = 0 if case_sensitive else re.IGNORECASE
+        return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+    def _compile_search(
+        self, patterns: Union[str, List[str]], case_sensitive: bool
+    ) -> "re.Pattern[str]":
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        return self._compile_patterns(tuple(patterns), case_sensitive)
+
     async def search_files(
-        self, query: str, path: str = "", case_sensitive: bool = False
+        self,
+        query: Union[str, List[str]],
+        path: str = "",
+        case_sensitive: bool = False,
     ) -> List[Dict[str, str]]:
-        """Search for files containing the query string."""
+        """Search for files containing the query string (or any of several)."""
         try:
             search_path = self.base_path / path
             if not search_path.exists():
                 raise FileNotFoundError(f"Search path not found: {path}")
 
-            results = []
-            pattern = re.compile(query if case_sensitive else query.lower())
-
-            async def search_file(file_path: Path) -> None:
-                if file_path.suffix not in self.allowed_extensions:
-                    return
-
-                try:
-                    async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                        content = await f.read()
-                        if not case_sensitive:
-                            content = content.lower()
-
-                        if pattern.search(content):
-                            results.append(
-                                {
-                                    "path": str(file_path.relative_to(self.base_path)),
-                                    "name": file_path.name,
-                                    "type": "file",
-                                }
-                            )
-                except Exception:
-                    # Skip files that can't be read
-                    pass
-
-            async def search_directory(dir_path: Path) -> None:
-                for item in dir_path.iterdir():
-                    if item.is_file():
-                        await search_file(item)
-                    elif item.is_dir():
-                        await search_directory(item)
-
-            await search_directory(search_path)
+            pattern = self._compile_search(query, case_sensitive)
+            files = await asyncio.to_thread(self._list_searchable_files, search_path)
+
+            # Spread the files over the default executor's threads, one batch
+            # per CPU: their reads overlap and the loop hears back per batch
+            workers = os.cpu_count() or 1
+            batches = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._grep_files, files[i::workers], pattern)
+                    for i in range(min(workers, len(files)))
+                )
+            )
+            results = [match for batch in batches for match in batch]
             return sorted(results, key=lambda x: x["path"])
         except Exception as e:
             raise Exception(f"Error searching files: {str(e)}")
 
     async def search_by_name(
-        self, pattern: str, path: str = "", case_sensitive: bool = False
+        self,
+        pattern: Union[str, List[str]],
+        path: str = "",
+        case_sensitive: bool = False,
     ) -> List[Dict[str, str]]:
-        """Search for files matching the name pattern."""
+        """Search for files matching the name pattern (or any of several)."""
         try:
             search_path = self.base_path / path
             if not search_path.exists():
                 raise FileNotFoundError(f"Search path not found: {path}")
 
             results = []
-            regex = re.compile(pattern if case_sensitive else pattern.lower())
-
-            async def search_directory(dir_path: Path) -> None:
-                for item in dir_path.iterdir():
-                    if item.is_file():
-                        name = item.name if case_sensitive else item.name.lower()
-                        if (
-                            regex.search(name)
-                            and item.suffix in self.allowed_extensions
-                        ):
-                            results.append(
-                                {
-                                    "path": str(item.relative_to(self.base_path)),
-                                    "name": item.name,
-                                    "type": "file",
-                                }
-                            )
-                    elif item.is_dir():
-                        await search_directory(item)
-
-            await search_directory(search_path)
+            regex = self._compile_search(pattern, case_sensitive)
+
+            files = await asyncio.to_thread(self._list_searchable_files, search_path)
+            for file_path, name in files:
+                if regex.search(name):
+                    results.append(
+                        {
+                            "path": os.path.relpath(file_path, self.base_path),
+                            "name": name,
+                            "type": "file",
+                        }
+                    )
             return sorted(results, key=lambda x: x["path"])
         except Exception as e:
             raise Exception(f"Error searching files by name: {str(e)}")
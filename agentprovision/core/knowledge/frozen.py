@@ -0,0 +1,36 @@
+"""
+Helpers for publishing the static knowledge bases as read-only data
+"""
+
+import sys
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts to read-only mappings (with interned keys)
+    and lists to tuples, so the knowledge constants cannot be mutated at runtime
+    """
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {
+                sys.intern(k) if isinstance(k, str) else k: freeze(v)
+                for k, v in value.items()
+            }
+        )
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Inverse of freeze: plain dicts and lists again, e.g. for text rendering
+    where mappingproxy and tuple reprs would leak into the output
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
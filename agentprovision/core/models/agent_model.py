@@ -11,7 +11,7 @@ from sqlalchemy import (JSON, Boolean, Column, DateTime, Enum, ForeignKey,
                         Integer, String)
 from sqlalchemy.orm import relationship
 
-from agentprovision.core.base import Base
+from agentprovision.core.base import Base, utcnow
 
 
 class AgentType(enum.Enum):
@@ -79,6 +79,9 @@ class Agent(Base):
     """Agent model for multi-agent support."""
 
     __tablename__ = "agents"
+    # Fetch database-generated values (updated_at) when flushing, so they are
+    # never left expired on an async session
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True, nullable=False)
@@ -89,7 +92,14 @@ class Agent(Base):
     config = Column(JSON, nullable=True)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Stamped in UTC by the database on UPDATE, so every writer shares one
+    # clock and it agrees with created_at
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
+    )
     version = Column(String, default="1.0.0")
     status = Column(String, default="idle")  # idle, running, error, etc.
     last_run_at = Column(DateTime, nullable=True)
@@ -7,10 +7,10 @@ from typing import List, Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import JSON, Boolean, Column, DateTime, Integer, String
+from sqlalchemy import JSON, Boolean, Column, DateTime, Index, Integer, String
 from sqlalchemy.orm import relationship
 
-from agentprovision.core.base import Base
+from agentprovision.core.base import Base, utcnow
 
 from .audit_log_model import AuditLog
 
@@ -61,6 +61,13 @@ class Tenant(Base):
     """Tenant model for multi-tenant support."""
 
     __tablename__ = "tenants"
+    # Serves the filtered, id-ordered keyset pages of list_tenants
+    __table_args__ = (
+        Index("ix_tenants_active_tier_id", "is_active", "subscription_tier", "id"),
+    )
+    # Fetch database-generated values (updated_at) when flushing, so they are
+    # never left expired on an async session
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True, nullable=False)
@@ -68,7 +75,14 @@ class Tenant(Base):
     description = Column(String, nullable=True)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Stamped in UTC by the database on UPDATE, so every writer shares one
+    # clock and it agrees with created_at
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
+    )
     settings = Column(JSON, nullable=True)
     compliance_status = Column(JSON, nullable=True)
     max_agents = Column(Integer, default=100)
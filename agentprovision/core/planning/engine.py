@@ -6,6 +6,8 @@ import logging
 import re
 import uuid
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 
 from agentprovision.core.code_gen.gemini import GeminiClient
@@ -13,18 +15,25 @@ from agentprovision.core.planning.models import (SolutionPlan, Task,
                                                  TaskPriority, TaskStatus)
 from agentprovision.core.ticket_engine.models import Requirement, Ticket
 
+_COMPLEXITY_RE = re.compile(r"\b(implement|create|add|build|develop)\b")
 
-class PlanningEngine:
-    """Engine for creating and managing solution plans."""
 
-    def __init__(self):
-        """Initialize the Planning Engine."""
-        self.priority_keywords = {
-            TaskPriority.CRITICAL: ["critical", "urgent", "blocker", "security"],
-            TaskPriority.HIGH: ["important", "high", "priority", "core"],
-            TaskPriority.MEDIUM: ["medium", "normal", "standard"],
-            TaskPriority.LOW: ["low", "nice to have", "optional"],
+class PlanningEngine:
+    """
+    Engine for creating and managing solution plans.
+
+    One instance is shared by all requests, so it holds no mutable state.
+    """
+
+    # Read-only, so concurrent requests can share it without locking
+    priority_keywords = MappingProxyType(
+        {
+            TaskPriority.CRITICAL: ("critical", "urgent", "blocker", "security"),
+            TaskPriority.HIGH: ("important", "high", "priority", "core"),
+            TaskPriority.MEDIUM: ("medium", "normal", "standard"),
+            TaskPriority.LOW: ("low", "nice to have", "optional"),
         }
+    )
 
     def create_solution_plan(
         self, ticket: Ticket, requirements: List[Requirement]
@@ -112,10 +121,14 @@ class PlanningEngine:
 
         return TaskPriority.MEDIUM  # Default priority
 
-    def _estimate_effort(self, description: str) -> int:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _estimate_effort(description: str) -> int:
         """
         Estimate effort required for a task in hours.
 
+        The estimate depends only on the description, so results are memoized.
+
         Args:
             description: Task description
 
@@ -124,9 +137,7 @@ class PlanningEngine:
         """
         # Simple estimation based on description length and complexity
         words = len(description.split())
-        complexity = len(
-            re.findall(r"\b(implement|create|add|build|develop)\b", description.lower())
-        )
+        complexity = len(_COMPLEXITY_RE.findall(description.lower()))
 
         # Base effort: 2 hours
         # Add 0.5 hours per 10 words
@@ -214,6 +225,7 @@ class PlanningEngine:
             Tuple[bool, List[str]]: (is_valid, list_of_errors)
         """
         errors = []
+        task_ids = {task.id for task in plan.tasks}
 
         # Validate required fields
         if not plan.ticket_id:
@@ -234,14 +246,55 @@ class PlanningEngine:
                 errors.append(f"Task {task.id} must have an effort estimate")
 
             # Validate dependencies
-            if task.dependencies:
-                dep_ids = task.dependencies.split(",")
-                for dep_id in dep_ids:
-                    if not any(t.id == dep_id for t in plan.tasks):
-                        errors.append(f"Task {task.id} has invalid dependency {dep_id}")
+            for dep_id in sorted(task.dependency_ids - task_ids):
+                errors.append(f"Task {task.id} has invalid dependency {dep_id}")
+
+        cycle = self.find_dependency_cycle(plan.tasks)
+        if cycle:
+            errors.append(f"Circular dependency detected: {' -> '.join(cycle)}")
 
         return len(errors) == 0, errors
 
+    def find_dependency_cycle(self, tasks: List[Task]) -> Optional[List[str]]:
+        """
+        Find a cycle in the task dependency graph.
+
+        Uses an iterative three-colour depth-first search, so the whole graph
+        is checked in O(V + E). Dependencies on unknown task IDs are ignored.
+
+        Args:
+            tasks: Tasks whose dependencies should be checked
+
+        Returns:
+            Optional[List[str]]: Task IDs forming the cycle (first ID repeated
+            at the end), or None if the dependencies are acyclic
+        """
+        by_id = {task.id: task for task in tasks}
+        white, gray, black = 0, 1, 2
+        color = dict.fromkeys(by_id, white)
+
+        for root in by_id:
+            if color[root] != white:
+                continue
+            color[root] = gray
+            path = [root]
+            stack = [iter(by_id[root].dependency_ids)]
+            while stack:
+                dep_id = next(stack[-1], None)
+                if dep_id is None:
+                    color[path.pop()] = black
+                    stack.pop()
+                elif dep_id not in by_id or color[dep_id] == black:
+                    continue
+                elif color[dep_id] == gray:
+                    return path[path.index(dep_id) :] + [dep_id]
+                else:
+                    color[dep_id] = gray
+                    path.append(dep_id)
+                    stack.append(iter(by_id[dep_id].dependency_ids))
+
+        return None
+
 
 class SolutionPlanner:
     def __init__(self):
@@ -4,10 +4,11 @@ Models for the Solution Planning & Strategy Module.
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 from pydantic import \
     BaseModel as PydanticBaseModel  # Added for Pydantic response models
+from pydantic import ConfigDict
 from sqlalchemy import Column, DateTime
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import ForeignKey, Integer, String, Text
@@ -54,6 +55,13 @@ class Task(Base):
     # Relationships
     plan = relationship("SolutionPlan", back_populates="tasks")
 
+    @property
+    def dependency_ids(self) -> FrozenSet[str]:
+        """IDs of the tasks this task depends on."""
+        if not self.dependencies:
+            return frozenset()
+        return frozenset(self.dependencies.split(","))
+
 
 class SolutionPlan(Base):
     """Model representing a solution plan for a ticket."""
@@ -88,8 +96,7 @@ class TaskResponse(PydanticBaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SolutionPlanResponse(PydanticBaseModel):
@@ -101,5 +108,4 @@ class SolutionPlanResponse(PydanticBaseModel):
     updated_at: datetime
     tasks: List[TaskResponse] = []
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
@@ -17,7 +17,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agentprovision.core.config import get_settings
@@ -94,6 +94,20 @@ class WorkflowDefinition(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class OrchestrationSnapshot(BaseModel):
+    """Point-in-time agent and queue counters for one tenant."""
+
+    model_config = ConfigDict(frozen=True)
+
+    total_agents: int
+    active_agents: int
+    healthy_agents: int
+    current_tasks: int
+    max_tasks: int
+    queued_tasks: Dict[TaskPriority, int]
+    running_tasks: int
+
+
 class AgentOrchestrator:
     """
     Core orchestration service for managing agents and tasks.
@@ -110,6 +124,9 @@ class AgentOrchestrator:
         self.running_tasks: Dict[UUID, AgentTask] = {}
         self.workflows: Dict[UUID, WorkflowDefinition] = {}
         self._orchestrator_running = False
+        # Wakes the scheduler loop early; only that loop runs scheduling
+        # passes, so two passes never race over the same queues
+        self._schedule_requested = asyncio.Event()
 
     async def start_orchestrator(self):
         """Start the orchestration service."""
@@ -132,18 +149,28 @@ class AgentOrchestrator:
             f"Submitting task {task.id} of type {task.task_type} for tenant {task.tenant_id}"
         )
 
-        # Validate task
-        if not await self._validate_task(task):
-            raise ValueError(f"Invalid task: {task.id}")
+        task_ids = await self.submit_tasks_bulk([task])
+        return task_ids[0]
 
-        # Add to appropriate priority queue
-        self.task_queue[task.priority].append(task)
+    async def submit_tasks_bulk(self, tasks: List[AgentTask]) -> List[UUID]:
+        """Submit several tasks at once; none are queued if any is invalid."""
+        # Validate tasks
+        for task in tasks:
+            if not await self._validate_task(task):
+                raise ValueError(f"Invalid task: {task.id}")
 
-        # Trigger immediate scheduling for high priority tasks
-        if task.priority in [TaskPriority.CRITICAL, TaskPriority.HIGH]:
-            asyncio.create_task(self._schedule_task(task))
+        # Add to the priority queues
+        for task in tasks:
+            self.task_queue[task.priority].append(task)
 
-        return task.id
+        # Have the scheduler run its next pass now for high priority tasks
+        if any(
+            task.priority in (TaskPriority.CRITICAL, TaskPriority.HIGH)
+            for task in tasks
+        ):
+            self._schedule_requested.set()
+
+        return [task.id for task in tasks]
 
     async def submit_workflow(self, workflow: WorkflowDefinition) -> UUID:
         """Submit a workflow for execution."""
@@ -203,6 +230,31 @@ class AgentOrchestrator:
 
         return mock_agents
 
+    async def snapshot(self, tenant_id: int) -> OrchestrationSnapshot:
+        """Count a tenant's agents and the task queues in a single pass each."""
+        agents = await self.get_tenant_agents(tenant_id)
+
+        # No awaits from here on, so nothing can change the queues or the
+        # running tasks while they are being counted
+        active = healthy = current = maxc = 0
+        for agent in agents:
+            active += agent["is_active"]
+            healthy += agent["is_healthy"]
+            current += agent["current_tasks"]
+            maxc += agent["max_concurrent_tasks"]
+
+        return OrchestrationSnapshot(
+            total_agents=len(agents),
+            active_agents=active,
+            healthy_agents=healthy,
+            current_tasks=current,
+            max_tasks=maxc,
+            queued_tasks={
+                priority: len(queue) for priority, queue in self.task_queue.items()
+            },
+            running_tasks=len(self.running_tasks),
+        )
+
     async def scale_agent(self, agent_id: int, max_concurrent_tasks: int) -> bool:
         """Scale an agent's capacity."""
         if agent_id not in self.agent_capacities:
@@ -289,8 +341,15 @@ class AgentOrchestrator:
         """Background task scheduler."""
         while self._orchestrator_running:
             try:
+                # Cleared before the pass, so a request made during it
+                # triggers another pass straight away
+                self._schedule_requested.clear()
                 await self._schedule_next_tasks()
-                await asyncio.sleep(1)  # Check every second
+                try:
+                    # Check every second, or sooner when a pass is requested
+                    await asyncio.wait_for(self._schedule_requested.wait(), 1)
+                except asyncio.TimeoutError:
+                    pass
             except Exception as e:
                 logger.error(f"Error in task scheduler: {e}")
                 await asyncio.sleep(5)
@@ -17,7 +17,7 @@ from typing import Any, Dict, List, Optional, Type
 from uuid import UUID, uuid4
 
 import psutil
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from agentprovision.core.config import get_settings
 from agentprovision.core.interfaces.agent_interface import (AgentConfig,
@@ -69,8 +69,7 @@ class AgentInstance(BaseModel):
     error_message: Optional[str] = None
     restart_count: int = 0
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class FullStackAgent(BaseAgent):
@@ -792,11 +791,11 @@ class AgentRuntime:
 
         return {
             "id": agent_id,
-            "config": instance.config.dict(),
+            "config": instance.config.model_dump(),
             "state": instance.state,
             "health_status": health_status,
-            "metrics": metrics.dict(),
-            "resource_usage": resource_usage.dict(),
+            "metrics": metrics.model_dump(),
+            "resource_usage": resource_usage.model_dump(),
             "created_at": instance.created_at,
             "started_at": instance.started_at,
             "last_heartbeat": instance.last_heartbeat,
@@ -303,7 +303,8 @@ class APIGateway:
             "status_codes": status_codes,
             "endpoints": endpoints,
             "circuit_breakers": {
-                name: state.dict() for name, state in self.circuit_breakers.items()
+                name: state.model_dump()
+                for name, state in self.circuit_breakers.items()
             },
         }
 
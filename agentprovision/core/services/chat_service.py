@@ -255,7 +255,7 @@ class ChatService:
                 conversation_id=conversation_id,
                 message_type=MessageType.TOOL_RESULT,
                 content=f"Tool {tool_name} executed {'successfully' if result.success else 'with errors'}",
-                metadata={"tool_result": result.dict()},
+                metadata={"tool_result": result.model_dump()},
                 status=MessageStatus.COMPLETED,
                 tool_results=[result],
             )
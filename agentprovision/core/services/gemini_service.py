@@ -11,6 +11,7 @@ import google.generativeai as genai
 
 from ..config import settings
 from ..database import get_redis
+from ..knowledge.frozen import thaw
 
 
 class GeminiService:
@@ -27,7 +28,7 @@ class GeminiService:
         Generate a unique cache key for the request
         """
         # Create a deterministic string from the context
-        context_str = json.dumps(context, sort_keys=True)
+        context_str = json.dumps(context, sort_keys=True, default=dict)
         # Generate a hash of the prompt type and context
         return f"gemini:{prompt_type}:{hashlib.md5(context_str.encode()).hexdigest()}"
 
@@ -140,7 +141,8 @@ class GeminiService:
         """
         Prepare prompt for Terraform code generation
         """
-        knowledge_base = context["knowledge_base"]
+        # The knowledge constants are frozen; render them as plain data
+        knowledge_base = thaw(context["knowledge_base"])
         requirements = context["requirements"]
 
         prompt = f"""
@@ -170,7 +172,8 @@ class GeminiService:
         """
         Prepare prompt for Helm chart generation
         """
-        knowledge_base = context["knowledge_base"]
+        # The knowledge constants are frozen; render them as plain data
+        knowledge_base = thaw(context["knowledge_base"])
         requirements = context["requirements"]
 
         prompt = f"""
@@ -199,7 +202,8 @@ class GeminiService:
         """
         Prepare prompt for Kubernetes troubleshooting
         """
-        knowledge_base = context["knowledge_base"]
+        # The knowledge constants are frozen; render them as plain data
+        knowledge_base = thaw(context["knowledge_base"])
         issue_description = context["issue_description"]
 
         prompt = f"""
@@ -5,13 +5,11 @@ Integrates Terraform, Kubernetes, and Helm capabilities
 
 import hashlib
 import json
+from functools import cached_property
 from typing import Any, Dict, Optional
 
 from ..database import get_redis
-from ..knowledge.helm_knowledge import (HELM_BEST_PRACTICES,
-                                        HELM_CHART_STRUCTURE, HELM_TESTING)
-from ..knowledge.kubernetes_knowledge import (KUBERNETES_BEST_PRACTICES,
-                                              KUBERNETES_TROUBLESHOOTING)
+from ..knowledge import helm_knowledge, kubernetes_knowledge
 from ..knowledge.terraform_knowledge import (TERRAFORM_BEST_PRACTICES,
                                              TERRAFORM_MODULES,
                                              TERRAFORM_PROVIDERS,
@@ -30,14 +28,22 @@ class IACService:
             "best_practices": TERRAFORM_BEST_PRACTICES,
             "templates": TERRAFORM_TEMPLATES,
         }
-        self.kubernetes_knowledge = {
-            "troubleshooting": KUBERNETES_TROUBLESHOOTING,
-            "best_practices": KUBERNETES_BEST_PRACTICES,
+
+    # The Kubernetes and Helm knowledge modules build their data lazily, so
+    # only touch them once a request actually needs them.
+    @cached_property
+    def kubernetes_knowledge(self) -> Dict[str, Any]:
+        return {
+            "troubleshooting": kubernetes_knowledge.KUBERNETES_TROUBLESHOOTING,
+            "best_practices": kubernetes_knowledge.KUBERNETES_BEST_PRACTICES,
         }
-        self.helm_knowledge = {
-            "structure": HELM_CHART_STRUCTURE,
-            "best_practices": HELM_BEST_PRACTICES,
-            "testing": HELM_TESTING,
+
+    @cached_property
+    def helm_knowledge(self) -> Dict[str, Any]:
+        return {
+            "structure": helm_knowledge.HELM_CHART_STRUCTURE,
+            "best_practices": helm_knowledge.HELM_BEST_PRACTICES,
+            "testing": helm_knowledge.HELM_TESTING,
         }
 
     def _generate_cache_key(self, operation: str, data: Dict[str, Any]) -> str:
@@ -122,6 +122,14 @@ class LLMResponse(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class LLMScriptRequest(BaseModel):
+    """Batch of dependent LLM requests executed server-side as a DAG."""
+
+    requests: List[LLMRequest]
+    # Maps a request index to the indices it depends on
+    deps: Dict[int, List[int]] = Field(default_factory=dict)
+
+
 class LLMUsageMetrics(BaseModel):
     """LLM usage metrics."""
 
@@ -488,6 +496,73 @@ class LLMEngine:
 
             raise
 
+    async def generate_script(
+        self, requests: List[LLMRequest], deps: Dict[int, List[int]]
+    ) -> List[LLMResponse]:
+        """
+        Execute a DAG of dependent requests in a single call.
+
+        Independent requests run concurrently; a request starts as soon as all
+        of its dependencies have completed. Any ``{prev}`` placeholder in a
+        dependent request's prompt is replaced with the content of its
+        dependencies' responses, so chained workflows need no client roundtrip
+        between steps.
+        """
+        order = self._topological_order(len(requests), deps)
+        tasks: Dict[int, asyncio.Task] = {}
+
+        async def run_node(index: int) -> LLMResponse:
+            parents = deps.get(index, [])
+            if parents:
+                parent_responses = await asyncio.gather(*(tasks[p] for p in parents))
+                request = requests[index]
+                if "{prev}" in request.prompt:
+                    prev = "\n\n".join(r.content for r in parent_responses)
+                    request.prompt = request.prompt.replace("{prev}", prev)
+            return await self.generate(requests[index])
+
+        # Tasks are created in topological order so every parent task exists
+        # before a dependent node awaits it
+        for index in order:
+            tasks[index] = asyncio.create_task(run_node(index))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        return [tasks[i].result() for i in range(len(requests))]
+
+    @staticmethod
+    def _topological_order(count: int, deps: Dict[int, List[int]]) -> List[int]:
+        """Return request indices ordered so dependencies come first."""
+        in_degree = [0] * count
+        children: Dict[int, List[int]] = {i: [] for i in range(count)}
+        for node, parents in deps.items():
+            if not 0 <= node < count:
+                raise ValueError(f"Invalid request index in deps: {node}")
+            for parent in parents:
+                if not 0 <= parent < count:
+                    raise ValueError(f"Invalid dependency index: {parent}")
+                children[parent].append(node)
+                in_degree[node] += 1
+
+        ready = [i for i in range(count) if in_degree[i] == 0]
+        order: List[int] = []
+        while ready:
+            node = ready.pop()
+            order.append(node)
+            for child in children[node]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    ready.append(child)
+
+        if len(order) != count:
+            raise ValueError("Request dependencies contain a cycle")
+        return order
+
     async def stream_generate(self, request: LLMRequest):
         """Stream generate response."""
         model, provider = await self._select_model_and_provider(request)
@@ -6,6 +6,8 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
+from pydantic import BaseModel as PydanticBaseModel
+from pydantic import ConfigDict
 from sqlalchemy import Column, DateTime
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import ForeignKey, String, Text
@@ -82,3 +84,38 @@ class Comment(Base):
 
     # Relationships
     ticket = relationship("Ticket", back_populates="comments")
+
+
+# Pydantic models for API responses
+
+
+class RequirementResponse(PydanticBaseModel):
+    id: str
+    ticket_id: str
+    description: str
+    status: TicketStatus
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TicketResponse(PydanticBaseModel):
+    id: str
+    key: Optional[str] = None
+    summary: str
+    description: Optional[str] = None
+    type: TicketType
+    status: TicketStatus
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TicketWithRequirementsResponse(PydanticBaseModel):
+    ticket: TicketResponse
+    requirements: List[RequirementResponse] = []
+    message: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,6 @@
+import asyncio
 import json
+import logging
 import os
 from datetime import datetime
 from pathlib import Path
@@ -9,12 +11,21 @@ from .config import settings
 from .models import (AgentInteraction, AgentResponse, Ticket, TicketFilter,
                      TicketUpdate)
 
+logger = logging.getLogger(__name__)
+
+# Interactions are written in batches, each batch costing one rewrite of the
+# ticket file: once this many are buffered, or after this many seconds
+INTERACTION_BATCH_SIZE = 32
+INTERACTION_FLUSH_DELAY = 0.5
+
 
 class TicketManager:
     def __init__(self):
         self.base_path = Path(settings.WORKSPACE_ROOT) / "tickets"
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.agent = Agent()
+        self._interaction_buffer: Dict[str, List[AgentInteraction]] = {}
+        self._flushers: Dict[str, asyncio.Task] = {}
 
     def _get_ticket_path(self, ticket_id: str) -> Path:
         """Get the path to a ticket's JSON file."""
@@ -29,7 +40,7 @@ class TicketManager:
             for file in self.base_path.glob("*.json"):
                 with open(file, "r") as f:
                     ticket_data = json.load(f)
-                    ticket = Ticket(**ticket_data)
+                    ticket = self._with_buffered_interactions(Ticket(**ticket_data))
 
                     if filter:
                         if not self._matches_filter(ticket, filter):
@@ -54,10 +65,17 @@ class TicketManager:
 
             with open(ticket_path, "r") as f:
                 ticket_data = json.load(f)
-                return Ticket(**ticket_data)
+                return self._with_buffered_interactions(Ticket(**ticket_data))
         except Exception as e:
             raise Exception(f"Error getting ticket: {str(e)}")
 
+    def _with_buffered_interactions(self, ticket: Ticket) -> Ticket:
+        """Append interactions still waiting to be flushed, so reads see them."""
+        buffered = self._interaction_buffer.get(ticket.id)
+        if buffered:
+            ticket.interactions.extend(buffered)
+        return ticket
+
     async def create_ticket(self, ticket: Ticket) -> Ticket:
         """Create a new ticket."""
         try:
@@ -69,7 +87,7 @@ class TicketManager:
             ticket.updated_at = datetime.utcnow()
 
             with open(ticket_path, "w") as f:
-                json.dump(ticket.dict(), f, default=str)
+                json.dump(ticket.model_dump(), f, default=str)
 
             return ticket
         except Exception as e:
@@ -80,12 +98,15 @@ class TicketManager:
     ) -> Optional[Ticket]:
         """Update a ticket."""
         try:
+            # Write pending interactions first so the rewrite below neither
+            # drops them nor leaves them to be appended a second time
+            await self.flush_interactions(ticket_id)
             ticket = await self.get_ticket(ticket_id)
             if not ticket:
                 return None
 
             # Update fields
-            update_data = update.dict(exclude_unset=True)
+            update_data = update.model_dump(exclude_unset=True)
             for key, value in update_data.items():
                 setattr(ticket, key, value)
 
@@ -93,7 +114,7 @@ class TicketManager:
 
             # Save changes
             with open(self._get_ticket_path(ticket_id), "w") as f:
-                json.dump(ticket.dict(), f, default=str)
+                json.dump(ticket.model_dump(), f, default=str)
 
             return ticket
         except Exception as e:
@@ -101,6 +122,10 @@ class TicketManager:
 
     async def delete_ticket(self, ticket_id: str) -> bool:
         """Delete a ticket."""
+        flusher = self._flushers.pop(ticket_id, None)
+        if flusher is not None:
+            flusher.cancel()
+        self._interaction_buffer.pop(ticket_id, None)
         try:
             ticket_path = self._get_ticket_path(ticket_id)
             if not ticket_path.exists():
@@ -114,19 +139,65 @@ class TicketManager:
     async def add_interaction(
         self, ticket_id: str, interaction: AgentInteraction
     ) -> None:
-        """Add an interaction to a ticket."""
-        try:
-            ticket = await self.get_ticket(ticket_id)
-            if not ticket:
-                raise ValueError(f"Ticket {ticket_id} not found")
+        """Add an interaction to a ticket (buffered; see flush_interactions)."""
+        buffer = self._interaction_buffer.setdefault(ticket_id, [])
+        buffer.append(interaction)
+        if len(buffer) >= INTERACTION_BATCH_SIZE:
+            await self.flush_interactions(ticket_id)
+        elif ticket_id not in self._flushers:
+            self._flushers[ticket_id] = asyncio.create_task(
+                self._flush_later(ticket_id)
+            )
 
-            ticket.interactions.append(interaction)
-            ticket.updated_at = datetime.utcnow()
+    async def flush_interactions(self, ticket_id: str) -> None:
+        """Write a ticket's buffered interactions to its file in one go."""
+        flusher = self._flushers.pop(ticket_id, None)
+        if flusher is not None:
+            flusher.cancel()
+        interactions = self._interaction_buffer.pop(ticket_id, None)
+        if not interactions:
+            return
 
-            with open(self._get_ticket_path(ticket_id), "w") as f:
-                json.dump(ticket.dict(), f, default=str)
+        try:
+            ticket = await self.get_ticket(ticket_id)
+            if ticket:
+                ticket.interactions.extend(interactions)
+                ticket.updated_at = datetime.utcnow()
+
+                # Serialized before the file is opened, so a failure cannot
+                # leave it truncated
+                data = json.dumps(ticket.model_dump(), default=str)
+                with open(self._get_ticket_path(ticket_id), "w") as f:
+                    f.write(data)
         except Exception as e:
+            # Put them back, ahead of anything buffered since, for the next flush
+            self._interaction_buffer[ticket_id] = (
+                interactions + self._interaction_buffer.get(ticket_id, [])
+            )
             raise Exception(f"Error adding interaction: {str(e)}")
+        if not ticket:
+            # The ticket is gone, so there is nothing to keep them for
+            raise Exception(f"Error adding interaction: Ticket {ticket_id} not found")
+
+    async def _flush_later(self, ticket_id: str) -> None:
+        """Flush a ticket's interactions once the flush delay has passed."""
+        await asyncio.sleep(INTERACTION_FLUSH_DELAY)
+        # Deregister first so flush_interactions does not cancel this task
+        self._flushers.pop(ticket_id, None)
+        try:
+            await self.flush_interactions(ticket_id)
+        except Exception:
+            logger.exception("Failed to flush interactions for ticket %s", ticket_id)
+
+    async def flush_all_interactions(self) -> None:
+        """Flush every ticket's buffered interactions, e.g. on shutdown."""
+        for ticket_id in list(self._interaction_buffer):
+            try:
+                await self.flush_interactions(ticket_id)
+            except Exception:
+                logger.exception(
+                    "Failed to flush interactions for ticket %s", ticket_id
+                )
 
     async def get_agent_response(self, ticket: Ticket, message: str) -> AgentResponse:
         """Get a response from the agent for a ticket interaction."""
@@ -214,7 +285,9 @@ class TicketManager:
                 {
                     "message": interaction.user_message,
                     "response": (
-                        interaction.response.dict() if interaction.response else None
+                        interaction.response.model_dump()
+                        if interaction.response
+                        else None
                     ),
                     "approved": interaction.approved,
                 }
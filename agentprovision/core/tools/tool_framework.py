@@ -8,20 +8,51 @@ enabling agents to execute various operations and interact with external systems
 import asyncio
 import json
 import logging
+import os
+import re
+import signal
 import subprocess
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID, uuid4
 
-import aiofiles
 import aiohttp
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger(__name__)
 
 
+def _sync_read(path: str, encoding: str) -> str:
+    """Blocking text read, dispatched to a worker thread in one hop."""
+    with open(path, "r", encoding=encoding) as f:
+        return f.read()
+
+
+def _sync_write(path: str, data: bytes) -> None:
+    """Blocking write of already-encoded content."""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _sync_list(path: str) -> List[Dict[str, Any]]:
+    """List a directory using cached DirEntry types instead of per-item stats."""
+    with os.scandir(path) as entries:
+        return [
+            {
+                "name": entry.name,
+                "type": "directory" if entry.is_dir() else "file",
+                "size": entry.stat().st_size if entry.is_file() else None,
+            }
+            for entry in entries
+        ]
+
+
 class ToolCategory(str, Enum):
     """Categories of tools available to agents."""
 
@@ -49,6 +80,8 @@ class ToolPermission(str, Enum):
 class ToolResult(BaseModel):
     """Result of tool execution."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     tool_name: str
     success: bool
     output: Any = None
@@ -61,6 +94,8 @@ class ToolResult(BaseModel):
 class ToolDefinition(BaseModel):
     """Definition of a tool that agents can use."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     category: ToolCategory
@@ -75,6 +110,8 @@ class ToolDefinition(BaseModel):
 class AgentSkill(BaseModel):
     """Represents a skill that an agent possesses."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     category: str
@@ -105,6 +142,10 @@ class BaseTool(ABC):
         """Get tool definition."""
         return self.definition
 
+    async def close(self):
+        """Release resources held by the tool."""
+        pass
+
     async def validate_parameters(self, parameters: Dict[str, Any]) -> bool:
         """Validate tool parameters."""
         # Basic validation - override in subclasses for specific validation
@@ -115,6 +156,8 @@ class BaseTool(ABC):
 class FileSystemTool(BaseTool):
     """Tool for file system operations."""
 
+    READ_CACHE_MAXSIZE = 128
+
     def __init__(self):
         definition = ToolDefinition(
             name="file_system",
@@ -144,67 +187,58 @@ class FileSystemTool(BaseTool):
             ],
         )
         super().__init__(definition)
+        # Keyed by (path, mtime_ns, size, encoding) so edits made outside the
+        # tool naturally miss the cache
+        self._read_cache: "OrderedDict[tuple, str]" = OrderedDict()
 
     async def execute(
         self, parameters: Dict[str, Any], context: Dict[str, Any] = None
     ) -> ToolResult:
         """Execute file system operation."""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
 
         try:
             operation = parameters.get("operation")
             path = parameters.get("path")
 
             if operation == "read":
-                async with aiofiles.open(
-                    path, "r", encoding=parameters.get("encoding", "utf-8")
-                ) as f:
-                    content = await f.read()
+                encoding = parameters.get("encoding", "utf-8")
+                stat = await asyncio.to_thread(os.stat, path)
+                cache_key = (path, stat.st_mtime_ns, stat.st_size, encoding)
+                content = self._read_cache.get(cache_key)
+                if content is None:
+                    content = await asyncio.to_thread(_sync_read, path, encoding)
+                    self._read_cache[cache_key] = content
+                    if len(self._read_cache) > self.READ_CACHE_MAXSIZE:
+                        self._read_cache.popitem(last=False)
+                else:
+                    self._read_cache.move_to_end(cache_key)
                 result = ToolResult(
                     tool_name=self.definition.name,
                     success=True,
                     output={"content": content, "size": len(content)},
-                    execution_time_ms=(datetime.utcnow() - start_time).total_seconds()
-                    * 1000,
+                    execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
                 )
 
             elif operation == "write":
                 content = parameters.get("content", "")
-                async with aiofiles.open(
-                    path, "w", encoding=parameters.get("encoding", "utf-8")
-                ) as f:
-                    await f.write(content)
+                data = content.encode(parameters.get("encoding", "utf-8"))
+                self._invalidate_read_cache(path)
+                await asyncio.to_thread(_sync_write, path, data)
                 result = ToolResult(
                     tool_name=self.definition.name,
                     success=True,
-                    output={"bytes_written": len(content.encode())},
-                    execution_time_ms=(datetime.utcnow() - start_time).total_seconds()
-                    * 1000,
+                    output={"bytes_written": len(data)},
+                    execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
                 )
 
             elif operation == "list":
-                import os
-
-                items = []
-                for item in os.listdir(path):
-                    item_path = os.path.join(path, item)
-                    items.append(
-                        {
-                            "name": item,
-                            "type": "directory" if os.path.isdir(item_path) else "file",
-                            "size": (
-                                os.path.getsize(item_path)
-                                if os.path.isfile(item_path)
-                                else None
-                            ),
-                        }
-                    )
+                items = await asyncio.to_thread(_sync_list, path)
                 result = ToolResult(
                     tool_name=self.definition.name,
                     success=True,
                     output={"items": items, "count": len(items)},
-                    execution_time_ms=(datetime.utcnow() - start_time).total_seconds()
-                    * 1000,
+                    execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
                 )
 
             else:
@@ -223,14 +257,244 @@ class FileSystemTool(BaseTool):
                 tool_name=self.definition.name,
                 success=False,
                 error_message=str(e),
-                execution_time_ms=(datetime.utcnow() - start_time).total_seconds()
-                * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
+            )
+
+    def _invalidate_read_cache(self, path: str):
+        """Drop cached reads for a path that is about to change."""
+        for key in [k for k in self._read_cache if k[0] == path]:
+            del self._read_cache[key]
+
+
+# Driver run by each pooled Python worker. Requests and responses are JSON
+# documents framed with a 4-byte big-endian length on stdin/stdout; fd 1 is
+# pointed at stderr so stray writes from user code cannot corrupt the stream.
+# The warm interpreter never runs user code itself: every request executes in
+# a freshly forked child, so builtins, sys.modules, os.environ and cwd changes
+# die with that child instead of leaking into the next caller's run.
+_PYTHON_WORKER_DRIVER = r"""
+import io
+import json
+import os
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+
+_in = sys.stdin.buffer
+_out = os.fdopen(os.dup(1), "wb")
+os.dup2(2, 1)
+
+
+def _child(request, write_fd):
+    # Keep user code away from the request and response streams
+    os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+    os.close(_out.fileno())
+    stdout_buffer = io.StringIO()
+    stderr_buffer = io.StringIO()
+    error = None
+    try:
+        os.chdir(request["cwd"])
+        with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
+            exec(compile(request["code"], "<agent>", "exec"), {"__name__": "__main__"})
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+    payload = json.dumps(
+        {
+            "stdout": stdout_buffer.getvalue(),
+            "stderr": stderr_buffer.getvalue(),
+            "error": error,
+        }
+    ).encode()
+    with os.fdopen(write_fd, "wb") as pipe:
+        pipe.write(payload)
+
+
+while True:
+    header = _in.read(4)
+    if len(header) < 4:
+        break
+    request = json.loads(_in.read(int.from_bytes(header, "big")))
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            _child(request, write_fd)
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        payload = pipe.read()
+    _, status = os.waitpid(pid, 0)
+    if not payload:
+        payload = json.dumps(
+            {
+                "stdout": "",
+                "stderr": "",
+                "error": f"Worker exited with status {os.waitstatus_to_exitcode(status)}",
+            }
+        ).encode()
+    _out.write(len(payload).to_bytes(4, "big") + payload)
+    _out.flush()
+"""
+
+
+class PythonWorkerPool:
+    """Pool of pre-started Python interpreters that run code sent over a pipe."""
+
+    def __init__(self, size: int = 2):
+        self.size = size
+        self._idle: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: set = set()
+
+    async def _spawn(self) -> asyncio.subprocess.Process:
+        # Each worker leads its own process group so killing it also takes
+        # down a forked child that is still running user code
+        worker = await asyncio.create_subprocess_exec(
+            "python3",
+            "-c",
+            _PYTHON_WORKER_DRIVER,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self._workers.add(worker)
+        return worker
+
+    def _kill(self, worker: asyncio.subprocess.Process):
+        self._workers.discard(worker)
+        try:
+            os.killpg(worker.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    async def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._idle is not None and self._loop is loop:
+            return
+        # Workers are bound to the loop that spawned them, so any left over
+        # from a previous loop are terminated rather than abandoned
+        for worker in list(self._workers):
+            self._kill(worker)
+        self._idle = asyncio.Queue()
+        self._loop = loop
+        for _ in range(self.size):
+            self._idle.put_nowait(await self._spawn())
+
+    @staticmethod
+    async def _exchange(
+        worker: asyncio.subprocess.Process, code: str, working_dir: str
+    ) -> Dict[str, Any]:
+        payload = json.dumps({"code": code, "cwd": working_dir}).encode()
+        worker.stdin.write(len(payload).to_bytes(4, "big") + payload)
+        await worker.stdin.drain()
+        header = await worker.stdout.readexactly(4)
+        body = await worker.stdout.readexactly(int.from_bytes(header, "big"))
+        return json.loads(body)
+
+    async def run(self, code: str, timeout: int, working_dir: str) -> Dict[str, Any]:
+        """Run code on an idle worker, restarting the worker if it hangs or dies.
+
+        ``timeout`` covers both waiting for an idle worker and the run itself.
+        """
+        await self._ensure_started()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        idle = self._idle
+        worker = await asyncio.wait_for(idle.get(), timeout=timeout)
+        healthy = False
+        try:
+            if worker.returncode is not None:
+                self._workers.discard(worker)
+                worker = await self._spawn()
+            result = await asyncio.wait_for(
+                self._exchange(worker, code, working_dir),
+                timeout=max(deadline - loop.time(), 0),
             )
+            healthy = True
+            return result
+        finally:
+            if not healthy:
+                if worker.returncode is None:
+                    self._kill(worker)
+                    await worker.wait()
+                self._workers.discard(worker)
+                worker = await self._spawn()
+            if idle is self._idle:
+                idle.put_nowait(worker)
+            else:
+                # The pool moved to another loop while this run was in flight
+                self._kill(worker)
+
+    async def close(self):
+        """Terminate all workers."""
+        if self._idle is None:
+            return
+        same_loop = self._loop is asyncio.get_running_loop()
+        for worker in list(self._workers):
+            self._kill(worker)
+            if same_loop:
+                await worker.wait()
+        self._idle = None
+        self._loop = None
+
+
+DANGEROUS_PATTERNS = [
+    "rm -rf",
+    "del /",
+    "format",
+    "mkfs",
+    "sudo",
+    "su -",
+    "chmod 777",
+    "eval(",
+    "exec(",
+    "import os",
+    "subprocess",
+    "system(",
+    "__import__",
+    "open(",
+]
+# Single case-insensitive pass over the code instead of one scan per pattern
+_DANGEROUS_RE = re.compile(
+    "|".join(re.escape(p) for p in DANGEROUS_PATTERNS), re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=1024)
+def _is_code_safe_cached(code: str, language: str) -> bool:
+    """Basic safety check for code execution, memoized per snippet."""
+    return _DANGEROUS_RE.search(code) is None
+
+
+async def _read_stream(stream: asyncio.StreamReader, limit: int = 1_000_000) -> bytes:
+    """Read a subprocess pipe to EOF, keeping at most ``limit`` bytes.
+
+    Output past the limit is still drained so the child never blocks on a
+    full pipe.
+    """
+    chunks = []
+    total = 0
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        if total < limit:
+            chunks.append(chunk[: limit - total])
+            total += len(chunks[-1])
+    return b"".join(chunks)
 
 
 class CodeExecutionTool(BaseTool):
     """Tool for executing code in various languages."""
 
+    # Caps concurrent interpreter subprocesses across all instances
+    _exec_sem = asyncio.Semaphore(int(os.getenv("AGENTPROVISION_MAX_EXEC", "4")))
+    _python_pool = PythonWorkerPool(
+        int(os.getenv("AGENTPROVISION_PYTHON_WORKERS", "2"))
+    )
+
     def __init__(self):
         definition = ToolDefinition(
             name="code_execution",
@@ -262,7 +526,7 @@ class CodeExecutionTool(BaseTool):
         self, parameters: Dict[str, Any], context: Dict[str, Any] = None
     ) -> ToolResult:
         """Execute code safely."""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
 
         try:
             language = parameters.get("language")
@@ -271,7 +535,7 @@ class CodeExecutionTool(BaseTool):
             working_dir = parameters.get("working_directory", "/tmp")
 
             # Security check - basic code safety validation
-            if not await self._is_code_safe(code, language):
+            if not _is_code_safe_cached(code, language):
                 return ToolResult(
                     tool_name=self.definition.name,
                     success=False,
@@ -280,11 +544,11 @@ class CodeExecutionTool(BaseTool):
 
             # Execute based on language
             if language == "python":
-                result = await self._execute_python(code, timeout, working_dir)
+                executor = self._execute_python
             elif language == "javascript":
-                result = await self._execute_javascript(code, timeout, working_dir)
+                executor = self._execute_javascript
             elif language == "bash":
-                result = await self._execute_bash(code, timeout, working_dir)
+                executor = self._execute_bash
             else:
                 return ToolResult(
                     tool_name=self.definition.name,
@@ -292,6 +556,9 @@ class CodeExecutionTool(BaseTool):
                     error_message=f"Unsupported language: {language}",
                 )
 
+            async with self._exec_sem:
+                result = await executor(code, timeout, working_dir)
+
             self.usage_count += 1
             self.last_used = datetime.utcnow()
             return result
@@ -301,85 +568,31 @@ class CodeExecutionTool(BaseTool):
                 tool_name=self.definition.name,
                 success=False,
                 error_message=str(e),
-                execution_time_ms=(datetime.utcnow() - start_time).total_seconds()
-                * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
             )
 
-    async def _is_code_safe(self, code: str, language: str) -> bool:
-        """Basic safety check for code execution."""
-        dangerous_patterns = [
-            "rm -rf",
-            "del /",
-            "format",
-            "mkfs",
-            "sudo",
-            "su -",
-            "chmod 777",
-            "eval(",
-            "exec(",
-            "import os",
-            "subprocess",
-            "system(",
-            "__import__",
-            "open(",
-        ]
-
-        code_lower = code.lower()
-        return not any(pattern in code_lower for pattern in dangerous_patterns)
+    async def close(self):
+        """Stop the warm Python workers."""
+        await self._python_pool.close()
 
     async def _execute_python(
         self, code: str, timeout: int, working_dir: str
     ) -> ToolResult:
-        """Execute Python code."""
+        """Execute Python code on a warm worker interpreter."""
+        start_ns = time.perf_counter_ns()
         try:
-            # Create a safe execution environment
-            safe_code = f"""
-import sys
-import io
-from contextlib import redirect_stdout, redirect_stderr
-
-stdout_buffer = io.StringIO()
-stderr_buffer = io.StringIO()
-
-try:
-    with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
-        {code}
-
-    print("EXECUTION_SUCCESS")
-    print("STDOUT:", stdout_buffer.getvalue())
-    print("STDERR:", stderr_buffer.getvalue())
-except Exception as e:
-    print("EXECUTION_ERROR:", str(e))
-"""
-
-            process = await asyncio.create_subprocess_exec(
-                "python3",
-                "-c",
-                safe_code,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=working_dir,
-            )
-
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=timeout
-            )
-
-            output = stdout.decode() if stdout else ""
-            error = stderr.decode() if stderr else ""
+            outcome = await self._python_pool.run(code, timeout, working_dir)
 
             return ToolResult(
                 tool_name=self.definition.name,
-                success="EXECUTION_SUCCESS" in output,
+                success=outcome["error"] is None,
                 output={
-                    "stdout": output,
-                    "stderr": error,
-                    "return_code": process.returncode,
+                    "stdout": outcome["stdout"],
+                    "stderr": outcome["stderr"],
+                    "return_code": 0 if outcome["error"] is None else 1,
                 },
-                execution_time_ms=(
-                    datetime.utcnow() - datetime.utcnow()
-                ).total_seconds()
-                * 1000,
+                error_message=outcome["error"],
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
             )
 
         except asyncio.TimeoutError:
@@ -393,64 +606,55 @@ except Exception as e:
         self, code: str, timeout: int, working_dir: str
     ) -> ToolResult:
         """Execute JavaScript code using Node.js."""
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "node",
-                "-e",
-                code,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=working_dir,
-            )
-
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=timeout
-            )
-
-            return ToolResult(
-                tool_name=self.definition.name,
-                success=process.returncode == 0,
-                output={
-                    "stdout": stdout.decode(),
-                    "stderr": stderr.decode(),
-                    "return_code": process.returncode,
-                },
-            )
-
-        except asyncio.TimeoutError:
-            return ToolResult(
-                tool_name=self.definition.name,
-                success=False,
-                error_message=f"Code execution timed out after {timeout} seconds",
-            )
+        process = await asyncio.create_subprocess_exec(
+            "node",
+            "-e",
+            code,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=working_dir,
+        )
+        return await self._collect_process_output(process, timeout)
 
     async def _execute_bash(
         self, code: str, timeout: int, working_dir: str
     ) -> ToolResult:
         """Execute Bash code."""
-        try:
-            process = await asyncio.create_subprocess_shell(
-                code,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=working_dir,
-            )
+        process = await asyncio.create_subprocess_shell(
+            code,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=working_dir,
+        )
+        return await self._collect_process_output(process, timeout)
 
+    async def _collect_process_output(
+        self, process: asyncio.subprocess.Process, timeout: int
+    ) -> ToolResult:
+        """Drain stdout and stderr concurrently and wait for the process."""
+        try:
             stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=timeout
+                asyncio.gather(
+                    _read_stream(process.stdout), _read_stream(process.stderr)
+                ),
+                timeout=timeout,
             )
+            await asyncio.wait_for(process.wait(), timeout=timeout)
 
             return ToolResult(
                 tool_name=self.definition.name,
                 success=process.returncode == 0,
                 output={
-                    "stdout": stdout.decode(),
-                    "stderr": stderr.decode(),
+                    "stdout": stdout.decode(errors="replace"),
+                    "stderr": stderr.decode(errors="replace"),
                     "return_code": process.returncode,
                 },
             )
 
         except asyncio.TimeoutError:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
             return ToolResult(
                 tool_name=self.definition.name,
                 success=False,
@@ -461,6 +665,11 @@ except Exception as e:
 class WebBrowsingTool(BaseTool):
     """Tool for web browsing and HTTP requests."""
 
+    # Only the head of the body is returned, so never buffer more than this
+    MAX_CONTENT_BYTES = 16 * 1024
+    REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+    RESPONSE_CACHE_MAXSIZE = 256
+
     def __init__(self):
         definition = ToolDefinition(
             name="web_browsing",
@@ -483,12 +692,31 @@ class WebBrowsingTool(BaseTool):
             ],
         )
         super().__init__(definition)
+        self._session: Optional[aiohttp.ClientSession] = None
+        # (url, request headers) -> (etag, last_modified, output) for
+        # conditional GETs
+        self._response_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100, ttl_dns_cache=300, keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def execute(
         self, parameters: Dict[str, Any], context: Dict[str, Any] = None
     ) -> ToolResult:
         """Execute web browsing operation."""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
 
         try:
             operation = parameters.get("operation")
@@ -511,8 +739,7 @@ class WebBrowsingTool(BaseTool):
                 tool_name=self.definition.name,
                 success=False,
                 error_message=str(e),
-                execution_time_ms=(datetime.utcnow() - start_time).total_seconds()
-                * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
             )
 
     async def _make_http_request(
@@ -523,23 +750,61 @@ class WebBrowsingTool(BaseTool):
         headers = parameters.get("headers", {})
         data = parameters.get("data")
 
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                method, url, headers=headers, json=data
-            ) as response:
-                content = await response.text()
-
+        cache_key = None
+        cached = None
+        if method == "GET":
+            cache_key = (url, tuple(sorted(headers.items())))
+            cached = self._response_cache.get(cache_key)
+            if cached:
+                etag, last_modified, _ = cached
+                headers = dict(headers)
+                if etag:
+                    headers.setdefault("If-None-Match", etag)
+                if last_modified:
+                    headers.setdefault("If-Modified-Since", last_modified)
+
+        session = await self._get_session()
+        async with session.request(
+            method, url, headers=headers, json=data, timeout=self.REQUEST_TIMEOUT
+        ) as response:
+            if response.status == 304 and cached:
+                self._response_cache.move_to_end(cache_key)
                 return ToolResult(
                     tool_name=self.definition.name,
-                    success=response.status < 400,
-                    output={
-                        "status_code": response.status,
-                        "headers": dict(response.headers),
-                        "content": content[:1000],  # Limit content size
-                        "content_length": len(content),
-                    },
+                    success=True,
+                    output=dict(cached[2]),
+                    metadata={"cache": "revalidated"},
                 )
 
+            raw = bytearray()
+            while len(raw) < self.MAX_CONTENT_BYTES:
+                chunk = await response.content.read(self.MAX_CONTENT_BYTES - len(raw))
+                if not chunk:
+                    break
+                raw.extend(chunk)
+            content = raw.decode(response.charset or "utf-8", errors="replace")
+
+            output = {
+                "status_code": response.status,
+                "headers": dict(response.headers),
+                "content": content[:1000],  # Limit content size
+                "content_length": int(response.headers.get("Content-Length", len(raw))),
+            }
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if cache_key and response.status == 200 and (etag or last_modified):
+                self._response_cache[cache_key] = (etag, last_modified, output)
+                self._response_cache.move_to_end(cache_key)
+                if len(self._response_cache) > self.RESPONSE_CACHE_MAXSIZE:
+                    self._response_cache.popitem(last=False)
+
+            return ToolResult(
+                tool_name=self.definition.name,
+                success=response.status < 400,
+                output=dict(output),
+            )
+
     async def _web_search(self, query: str) -> ToolResult:
         """Perform web search (simplified implementation)."""
         # This would integrate with a search API like Google Custom Search
@@ -559,6 +824,9 @@ class ToolRegistry:
 
     def __init__(self):
         self.tools: Dict[str, BaseTool] = {}
+        self._by_category: Dict[ToolCategory, List[BaseTool]] = defaultdict(list)
+        # Definitions are immutable, so their JSON is serialized once
+        self._definition_json: Dict[str, bytes] = {}
         self._initialize_default_tools()
 
     def _initialize_default_tools(self):
@@ -574,7 +842,14 @@ class ToolRegistry:
 
     def register_tool(self, tool: BaseTool):
         """Register a new tool."""
+        previous = self.tools.get(tool.definition.name)
+        if previous is not None:
+            self._by_category[previous.definition.category].remove(previous)
         self.tools[tool.definition.name] = tool
+        self._by_category[tool.definition.category].append(tool)
+        self._definition_json[tool.definition.name] = orjson.dumps(
+            tool.definition.model_dump(mode="json")
+        )
         logger.info(f"Registered tool: {tool.definition.name}")
 
     def get_tool(self, name: str) -> Optional[BaseTool]:
@@ -585,24 +860,76 @@ class ToolRegistry:
         self, category: Optional[ToolCategory] = None
     ) -> List[ToolDefinition]:
         """List available tools."""
-        tools = list(self.tools.values())
-
         if category:
-            tools = [t for t in tools if t.definition.category == category]
+            tools = self._by_category.get(category, [])
+        else:
+            tools = self.tools.values()
 
         return [tool.definition for tool in tools]
 
+    def list_tool_definitions_json(
+        self, category: Optional[ToolCategory] = None
+    ) -> bytes:
+        """List tool definitions as a pre-serialized JSON array."""
+        if category:
+            tools = self._by_category.get(category, [])
+        else:
+            tools = self.tools.values()
+
+        return (
+            b"["
+            + b",".join(self._definition_json[t.definition.name] for t in tools)
+            + b"]"
+        )
+
+    async def execute_many(
+        self,
+        calls: List[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]],
+        max_concurrency: int = 8,
+    ) -> List[ToolResult]:
+        """Run independent (tool_name, parameters, context) calls concurrently.
+
+        Results are returned in the same order as ``calls``.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(
+            tool_name: str, parameters: Dict[str, Any], context: Optional[Dict]
+        ) -> ToolResult:
+            tool = self.get_tool(tool_name)
+            if not tool:
+                return ToolResult(
+                    tool_name=tool_name,
+                    success=False,
+                    error_message=f"Tool {tool_name} not available",
+                )
+            async with semaphore:
+                return await tool.execute(parameters, context)
+
+        return await asyncio.gather(*(run_one(*call) for call in calls))
+
     def get_tools_for_skill(self, skill_name: str) -> List[BaseTool]:
         """Get tools associated with a specific skill."""
         # This would be enhanced with a skill-tool mapping
         return list(self.tools.values())
 
+    async def close(self):
+        """Release resources held by registered tools."""
+        for tool in self.tools.values():
+            try:
+                await tool.close()
+            except Exception as e:
+                logger.error(f"Error closing tool {tool.definition.name}: {e}")
+
 
 class SkillRegistry:
     """Registry for managing agent skills."""
 
     def __init__(self):
         self.skills: Dict[str, AgentSkill] = {}
+        self._by_category: Dict[str, List[AgentSkill]] = defaultdict(list)
+        # tool name -> skills using it, keyed by skill name
+        self._tool_to_skills: Dict[str, Dict[str, AgentSkill]] = defaultdict(dict)
         self._initialize_default_skills()
 
     def _initialize_default_skills(self):
@@ -676,7 +1003,15 @@ class SkillRegistry:
 
     def register_skill(self, skill: AgentSkill):
         """Register a new skill."""
+        previous = self.skills.get(skill.name)
+        if previous is not None:
+            self._by_category[previous.category].remove(previous)
+            for tool_name in previous.tools:
+                self._tool_to_skills[tool_name].pop(previous.name, None)
         self.skills[skill.name] = skill
+        self._by_category[skill.category].append(skill)
+        for tool_name in skill.tools:
+            self._tool_to_skills[tool_name][skill.name] = skill
         logger.info(f"Registered skill: {skill.name}")
 
     def get_skill(self, name: str) -> Optional[AgentSkill]:
@@ -685,20 +1020,19 @@ class SkillRegistry:
 
     def list_skills(self, category: Optional[str] = None) -> List[AgentSkill]:
         """List available skills."""
-        skills = list(self.skills.values())
-
         if category:
-            skills = [s for s in skills if s.category == category]
+            return list(self._by_category.get(category, []))
 
-        return skills
+        return list(self.skills.values())
 
     def get_skills_for_tools(self, tool_names: List[str]) -> List[AgentSkill]:
         """Get skills that use specific tools."""
-        return [
-            skill
-            for skill in self.skills.values()
-            if any(tool in skill.tools for tool in tool_names)
-        ]
+        matched: Dict[str, AgentSkill] = {}
+        for tool_name in tool_names:
+            skills = self._tool_to_skills.get(tool_name)
+            if skills:
+                matched.update(skills)
+        return list(matched.values())
 
 
 # Global registries
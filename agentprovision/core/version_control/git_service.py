@@ -6,6 +6,7 @@ from typing import Optional
 class GitService:
     def __init__(self, repo_path: str = "."):
         self.repo_path = repo_path
+        self._cached_branch: Optional[str] = None
 
     def run_git(self, *args) -> str:
         try:
@@ -14,31 +15,58 @@ class GitService:
                 cwd=self.repo_path,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
+                check=False,
             )
             if result.returncode != 0:
-                return f"Error: {result.stderr}"
-            return result.stdout
+                return f"Error: {result.stderr.decode(errors='replace')}"
+            return result.stdout.decode(errors="replace")
         except Exception as e:
             return f"Exception: {str(e)}"
 
+    def run_git_quiet(self, *args) -> None:
+        # For commands whose output is never read: stdout is not captured,
+        # and a failure surfaces through the git command that follows
+        try:
+            subprocess.run(
+                ["git", *args],
+                cwd=self.repo_path,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+        except Exception:
+            pass
+
     def init(self) -> str:
+        self.invalidate_branch_cache()
         return self.run_git("init")
 
     def branch(self, branch_name: str) -> str:
-        return self.run_git("checkout", "-b", branch_name)
+        result = self.run_git("checkout", "-b", branch_name)
+        if not result.startswith(("Error", "Exception")):
+            self._cached_branch = branch_name
+        return result
 
     def create_branch_with_ticket(self, ticket_number: str, description: str) -> str:
         branch_name = f"ticket-{ticket_number}-{description}"
         return self.branch(branch_name)
 
-    def commit(self, message: str) -> str:
-        self.run_git("add", ".")
+    def commit(self, message: str, fast: bool = False) -> str:
+        # fast uses -a to stage tracked changes in the same process, but
+        # skips untracked files; the default keeps the add-everything flow
+        if fast:
+            return self.run_git("commit", "-am", message)
+        return self.commit_all(message)
+
+    def commit_all(self, message: str) -> str:
+        self.run_git_quiet("add", ".")
         return self.run_git("commit", "-m", message)
 
-    def commit_with_ticket(self, ticket_number: str, message: str) -> str:
+    def commit_with_ticket(
+        self, ticket_number: str, message: str, fast: bool = False
+    ) -> str:
         commit_message = f"[Ticket #{ticket_number}] {message}"
-        return self.commit(commit_message)
+        return self.commit(commit_message, fast=fast)
 
     def push(self, remote: str = "origin", branch: Optional[str] = None) -> str:
         if branch is None:
@@ -46,5 +74,14 @@ class GitService:
         return self.run_git("push", remote, branch)
 
     def get_current_branch(self) -> str:
+        if self._cached_branch is not None:
+            return self._cached_branch
         result = self.run_git("rev-parse", "--abbrev-ref", "HEAD")
-        return result.strip() if not result.startswith("Error") else "main"
+        if result.startswith(("Error", "Exception")):
+            return "main"
+        self._cached_branch = result.strip()
+        return self._cached_branch
+
+    def invalidate_branch_cache(self) -> None:
+        """Forget the cached branch after checkouts made outside this service."""
+        self._cached_branch = None
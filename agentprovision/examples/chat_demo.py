@@ -10,28 +10,79 @@ This script demonstrates:
 
 import asyncio
 import json
+import sys
+from typing import Dict, Optional, Tuple
 from uuid import UUID
 
 import httpx
 
+# One pooled client per (base_url, api_key), shared by every demo instance so
+# repeated runs reuse open connections instead of paying new handshakes
+_shared_clients: Dict[Tuple[str, Optional[str]], httpx.AsyncClient] = {}
+
+
+def _auth_headers(api_key: Optional[str]) -> Dict[str, str]:
+    """Build the client's default auth header once; requests never override it."""
+    if not api_key:
+        return {}
+    return {"Authorization": sys.intern(f"Bearer {api_key}")}
+
+
+def get_shared_client(base_url: str, api_key: str = None) -> httpx.AsyncClient:
+    """Return the shared HTTP client for a server and API key."""
+    key = (base_url, api_key)
+    client = _shared_clients.get(key)
+    if client is None or client.is_closed:
+        client = _shared_clients[key] = httpx.AsyncClient(
+            base_url=base_url,
+            headers=_auth_headers(api_key),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+    return client
+
+
+async def close_shared_clients():
+    """Close every shared client; call once when the process is done."""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    await asyncio.gather(*(client.aclose() for client in clients))
+
 
 class AgentProvisionChatDemo:
     """Demo client for agentprovision chat interface."""
 
-    def __init__(self, base_url: str = "http://localhost:8001", api_key: str = None):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8001",
+        api_key: str = None,
+        max_concurrency: int = 8,
+    ):
         self.base_url = base_url
         self.api_key = api_key
-        self.client = httpx.AsyncClient(
-            base_url=base_url,
-            headers={"Authorization": f"Bearer {api_key}"} if api_key else {},
-        )
+        self.client = get_shared_client(base_url, api_key)
+        # Bounds concurrent requests so gathered and pipelined steps can't
+        # flood the server
+        self._sem = asyncio.Semaphore(max_concurrency)
 
     async def demo_chat_workflow(self):
         """Demonstrate a complete chat workflow."""
         print("🚀 Starting agentprovision Chat Demo")
         print("=" * 50)
 
+        catalog = None
         try:
+            # Tools and skills don't depend on any other step, so fetch them
+            # in the background while the workflow runs
+            catalog = asyncio.ensure_future(
+                asyncio.gather(self.list_tools(), self.list_skills())
+            )
+
             # 1. List available agents
             print("\n1. 📋 Listing available agents...")
             agents = await self.list_agents()
@@ -45,10 +96,14 @@ class AgentProvisionChatDemo:
                 print("No agents available. Please create an agent first.")
                 return
 
-            # 2. Get agent capabilities
+            # 2-3. Capabilities and the new conversation only need the agent id
             agent_id = agents[0]["id"]
             print(f"\n2. 🔍 Getting capabilities for agent {agent_id}...")
-            capabilities = await self.get_agent_capabilities(agent_id)
+            print(f"\n3. 💬 Creating conversation with agent...")
+            capabilities, conversation_id = await asyncio.gather(
+                self.get_agent_capabilities(agent_id),
+                self.create_conversation(agent_id, "Demo Chat Session"),
+            )
             if capabilities:
                 print(f"Agent Type: {capabilities['agent_type']}")
                 print(
@@ -56,11 +111,6 @@ class AgentProvisionChatDemo:
                 )
                 print(f"Tools: {', '.join([t['name'] for t in capabilities['tools']])}")
 
-            # 3. Create conversation
-            print(f"\n3. 💬 Creating conversation with agent...")
-            conversation_id = await self.create_conversation(
-                agent_id, "Demo Chat Session"
-            )
             print(f"Created conversation: {conversation_id}")
 
             # 4. Send initial message
@@ -79,35 +129,39 @@ class AgentProvisionChatDemo:
             )
             print(f"Agent Response: {response['content'][:300]}...")
 
-            # 6. Use file system tool
+            # 6-7. Save the code and run it. The run gets the source inline
+            # rather than reading the saved file, so both calls can be in
+            # flight at once
+            fibonacci_code = "def fibonacci(n, memo={}):\n    if n in memo:\n        return memo[n]\n    if n <= 2:\n        return 1\n    memo[n] = fibonacci(n-1, memo) + fibonacci(n-2, memo)\n    return memo[n]\n\nprint(f'Fibonacci(10) = {fibonacci(10)}')"
             print(f"\n6. 📁 Using file system tool to save code...")
-            tool_result = await self.execute_tool(
-                conversation_id,
-                "file_system",
-                {
-                    "operation": "write",
-                    "path": "/tmp/fibonacci.py",
-                    "content": "def fibonacci(n, memo={}):\n    if n in memo:\n        return memo[n]\n    if n <= 2:\n        return 1\n    memo[n] = fibonacci(n-1, memo) + fibonacci(n-2, memo)\n    return memo[n]\n\nprint(f'Fibonacci(10) = {fibonacci(10)}')",
-                },
-            )
-            print(
-                f"File operation result: {'Success' if tool_result['success'] else 'Failed'}"
-            )
-
-            # 7. Execute the code
             print(f"\n7. ⚡ Executing the Python code...")
-            tool_result = await self.execute_tool(
-                conversation_id,
-                "code_execution",
-                {
-                    "language": "python",
-                    "code": "exec(open('/tmp/fibonacci.py').read())",
-                },
+            file_result, exec_result = [
+                result
+                async for result in self._pipelined_tools(
+                    conversation_id,
+                    [
+                        (
+                            "file_system",
+                            {
+                                "operation": "write",
+                                "path": "/tmp/fibonacci.py",
+                                "content": fibonacci_code,
+                            },
+                        ),
+                        (
+                            "code_execution",
+                            {"language": "python", "code": fibonacci_code},
+                        ),
+                    ],
+                )
+            ]
+            print(
+                f"File operation result: {'Success' if file_result['success'] else 'Failed'}"
             )
-            if tool_result["success"]:
-                print(f"Code output: {tool_result['output']['stdout']}")
+            if exec_result["success"]:
+                print(f"Code output: {exec_result['output']['stdout']}")
             else:
-                print(f"Execution failed: {tool_result['error_message']}")
+                print(f"Execution failed: {exec_result['error_message']}")
 
             # 8. Ask for code review
             print(f"\n8. 🔍 Requesting code review...")
@@ -119,13 +173,14 @@ class AgentProvisionChatDemo:
 
             # 9. Get conversation history
             print(f"\n9. 📚 Getting conversation history...")
-            messages = await self.get_conversation_messages(conversation_id)
-            print(f"Total messages in conversation: {len(messages)}")
+            message_count = 0
+            async for _ in self.get_conversation_messages(conversation_id):
+                message_count += 1
+            print(f"Total messages in conversation: {message_count}")
 
             # 10. List available tools and skills
             print(f"\n10. 🛠️ Available tools and skills...")
-            tools = await self.list_tools()
-            skills = await self.list_skills()
+            tools, skills = await catalog
             print(f"Available tools: {', '.join([t['name'] for t in tools])}")
             print(f"Available skills: {', '.join([s['name'] for s in skills])}")
 
@@ -135,32 +190,43 @@ class AgentProvisionChatDemo:
             print(f"❌ Demo failed: {e}")
 
         finally:
-            await self.client.aclose()
+            if catalog is not None and not catalog.done():
+                catalog.cancel()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the shared client, within the concurrency limit."""
+        async with self._sem:
+            return await self.client.request(method, url, **kwargs)
 
     async def list_agents(self):
         """List available agents."""
-        response = await self.client.get("/api/v1/runtime/agents")
+        response = await self._request("GET", "/api/v1/runtime/agents")
         response.raise_for_status()
         return response.json()["agents"]
 
     async def get_agent_capabilities(self, agent_id: str):
         """Get agent capabilities."""
-        response = await self.client.get(f"/api/v1/chat/agents/{agent_id}/capabilities")
+        response = await self._request(
+            "GET", f"/api/v1/chat/agents/{agent_id}/capabilities"
+        )
         if response.status_code == 200:
             return response.json()
         return None
 
     async def create_conversation(self, agent_id: str, title: str = None) -> str:
         """Create a new conversation."""
-        response = await self.client.post(
-            "/api/v1/chat/conversations", json={"agent_id": agent_id, "title": title}
+        response = await self._request(
+            "POST",
+            "/api/v1/chat/conversations",
+            json={"agent_id": agent_id, "title": title},
         )
         response.raise_for_status()
         return response.json()["conversation_id"]
 
     async def send_message(self, conversation_id: str, content: str):
         """Send a message to the agent."""
-        response = await self.client.post(
+        response = await self._request(
+            "POST",
             f"/api/v1/chat/conversations/{conversation_id}/messages",
             json={"content": content},
         )
@@ -171,30 +237,76 @@ class AgentProvisionChatDemo:
         self, conversation_id: str, tool_name: str, parameters: dict
     ):
         """Execute a tool in the conversation context."""
-        response = await self.client.post(
+        response = await self._request(
+            "POST",
             f"/api/v1/chat/conversations/{conversation_id}/tools",
             json={"tool_name": tool_name, "parameters": parameters},
         )
         response.raise_for_status()
         return response.json()
 
-    async def get_conversation_messages(self, conversation_id: str):
-        """Get messages from a conversation."""
-        response = await self.client.get(
-            f"/api/v1/chat/conversations/{conversation_id}/messages"
-        )
-        response.raise_for_status()
-        return response.json()
+    async def _pipelined_tools(
+        self, conversation_id: str, calls: list, max_inflight: int = 8
+    ):
+        """
+        Execute (tool_name, parameters) calls with up to max_inflight requests
+        in flight on the shared connection, yielding results in input order.
+        """
+        pending = iter(enumerate(calls))
+        inflight = {}  # task -> index of its call
+        finished = {}  # index -> result, buffered until its turn
+        next_index = 0
+        try:
+            while True:
+                for index, (tool_name, parameters) in pending:
+                    task = asyncio.ensure_future(
+                        self.execute_tool(conversation_id, tool_name, parameters)
+                    )
+                    inflight[task] = index
+                    if len(inflight) >= max_inflight:
+                        break
+                if not inflight:
+                    return
+                done, _ = await asyncio.wait(
+                    inflight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    finished[inflight.pop(task)] = task.result()
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+        finally:
+            for task in inflight:
+                task.cancel()
+
+    async def get_conversation_messages(
+        self, conversation_id: str, page_size: int = 50
+    ):
+        """Yield messages from a conversation, one page at a time."""
+        offset = 0
+        while True:
+            response = await self._request(
+                "GET",
+                f"/api/v1/chat/conversations/{conversation_id}/messages",
+                params={"limit": page_size, "offset": offset},
+            )
+            response.raise_for_status()
+            page = response.json()
+            for message in page:
+                yield message
+            if len(page) < page_size:
+                return
+            offset += page_size
 
     async def list_tools(self):
         """List available tools."""
-        response = await self.client.get("/api/v1/chat/tools")
+        response = await self._request("GET", "/api/v1/chat/tools")
         response.raise_for_status()
         return response.json()
 
     async def list_skills(self):
         """List available skills."""
-        response = await self.client.get("/api/v1/chat/skills")
+        response = await self._request("GET", "/api/v1/chat/skills")
         response.raise_for_status()
         return response.json()
 
@@ -203,7 +315,10 @@ async def main():
     """Run the demo."""
     # Note: In a real scenario, you would authenticate first to get an API token
     demo = AgentProvisionChatDemo()
-    await demo.demo_chat_workflow()
+    try:
+        await demo.demo_chat_workflow()
+    finally:
+        await close_shared_clients()
 
 
 if __name__ == "__main__":
@@ -95,17 +95,30 @@ def test_task_dependencies(planning_engine, sample_ticket, sample_requirements):
         for task in plan.tasks
     )
 
+    # Every dependency must point at a task in the plan
+    by_id = {task.id: task for task in plan.tasks}
+    assert all(dep_id in by_id for task in plan.tasks for dep_id in task.dependency_ids)
+
     # Check for circular dependencies
-    for task in plan.tasks:
-        visited = set()
-        current = task
-        while current and current.dependencies:
-            dep_ids = current.dependencies.split(",")
-            dep_id = dep_ids[0] if dep_ids else None
-            if dep_id in visited:
-                pytest.fail(f"Circular dependency detected for task {current.id}")
-            visited.add(current.id)
-            current = next((t for t in plan.tasks if t.id == dep_id), None)
+    assert planning_engine.find_dependency_cycle(plan.tasks) is None
+
+
+def test_circular_dependency_detection(planning_engine):
+    """Test that dependency cycles are reported."""
+    tasks = [
+        Task(id="a", title="A", dependencies="c"),
+        Task(id="b", title="B", dependencies="a"),
+        Task(id="c", title="C", dependencies="b"),
+        Task(id="d", title="D", dependencies="a"),
+    ]
+
+    cycle = planning_engine.find_dependency_cycle(tasks)
+    assert cycle is not None
+    assert cycle[0] == cycle[-1]
+    assert set(cycle) == {"a", "b", "c"}
+
+    tasks[0].dependencies = None
+    assert planning_engine.find_dependency_cycle(tasks) is None
 
 
 def test_estimate_task_effort(planning_engine, sample_ticket, sample_requirements):